@@ -0,0 +1,78 @@
+"""
+Helpers shared by the requests-enhanced example scripts.
+
+Not an example itself: run_examples.py skips modules whose names start with
+an underscore. Each example imports what it needs from here, which works
+because Python puts a script's own directory first on sys.path.
+"""
+
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, List, Tuple
+
+from requests_enhanced import Session
+
+# orjson is an optional, much faster JSON parser (pip install orjson). It
+# decodes the raw body bytes directly, skipping requests' charset detection.
+try:
+    import orjson
+
+    def _loads(response: Any) -> Any:
+        return orjson.loads(response.content)
+
+    _dumps = orjson.dumps
+
+except ImportError:
+
+    def _loads(response: Any) -> Any:
+        return response.json()
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+
+# Size connection pools like ThreadPoolExecutor's worker heuristic so bursts of
+# same-host requests reuse sockets, and block (rather than discard) when full
+POOL_KW = dict(
+    pool_connections=32,
+    pool_maxsize=max((os.cpu_count() or 4) * 5, 32),
+    pool_block=True,
+)
+
+
+def _fetch_all(
+    session: Session, urls: List[str]
+) -> Tuple[float, List[Tuple[str, Any]]]:
+    """
+    GET every URL concurrently and time the batch as a whole.
+
+    Outcomes are collected rather than printed so terminal I/O stays out of
+    the timed window.
+
+    Returns:
+        Elapsed seconds and (url, status_code or exception) pairs
+    """
+    results: List[Tuple[str, Any]] = []
+    start_time = time.perf_counter_ns()
+
+    with ThreadPoolExecutor(max_workers=len(urls)) as executor:
+        futures = {executor.submit(session.get, url): url for url in urls}
+        for future in as_completed(futures):
+            try:
+                with future.result() as response:
+                    results.append((futures[future], response.status_code))
+            except Exception as e:
+                results.append((futures[future], e))
+
+    return (time.perf_counter_ns() - start_time) / 1e9, results
+
+
+def _print_results(results: List[Tuple[str, Any]], protocol: str) -> None:
+    """Print the outcome of each request collected by _fetch_all."""
+    for url, outcome in results:
+        if isinstance(outcome, Exception):
+            print(f"Error with {protocol} request to {url}: {outcome}")
+        else:
+            print(f"Request to {url} completed with status {outcome}")
@@ -10,28 +10,134 @@ This example demonstrates advanced features of requests-enhanced sessions includ
 - Connection adapters
 """
 
+import asyncio
+import atexit
 import time
-from requests_enhanced import Session, HTTP2Adapter, HTTP3Adapter
-from requests_enhanced.adapters import HTTP3_AVAILABLE
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from itertools import cycle, islice
+from requests.structures import CaseInsensitiveDict
+from requests_enhanced import Session, HTTP2Adapter, HTTP3Adapter, __version__
+from requests_enhanced.adapters import HTTP2_AVAILABLE, HTTP3_AVAILABLE
+from urllib3.util.request import ACCEPT_ENCODING
 from urllib3.util.retry import Retry
 
-
-def connection_pooling_example():
+from _common import POOL_KW, _loads
+
+# httpx is optional (pip install httpx[http2]); it only backs the async
+# performance example, which is skipped when it is missing
+try:
+    import httpx
+
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+
+# Section rule printed around each script's output
+_BANNER = "=" * 50
+
+# Headers every session in this module starts with. Built once as a
+# CaseInsensitiveDict so sessions copy it instead of re-normalising literals.
+# urllib3's ACCEPT_ENCODING adds "br" only when a Brotli decoder is installed
+# (pip install requests-enhanced[brotli]), so compressed bodies always decode.
+_DEFAULT_HEADERS = CaseInsensitiveDict(
+    {
+        "User-Agent": f"requests-enhanced/{__version__}",
+        "Accept": "application/json",
+        "Accept-Encoding": ACCEPT_ENCODING,
+        "Connection": "keep-alive",
+    }
+)
+
+# Extra headers for the persistence example, layered over the defaults
+_PERSISTENT_HEADERS = CaseInsensitiveDict(
+    {
+        "User-Agent": "MyApp/1.0",
+        "X-API-Version": "2.0",
+    }
+)
+
+
+def _build_session(retry_config=None, adapters=None, headers=None, **kwargs):
+    """
+    Create a pooled Session with all of its adapters wired up front.
+
+    Every ``mount`` re-sorts the session's adapter table, so per-prefix
+    adapters are mounted here once rather than in code that runs per request.
+    Headers are likewise merged once: ``_DEFAULT_HEADERS`` first, then any
+    ``headers`` given by the caller.
+    """
+    session = Session(retry_config=retry_config, **{**POOL_KW, **kwargs})
+    session.headers.update(_DEFAULT_HEADERS)
+    if headers:
+        session.headers.update(headers)
+    for prefix, adapter in (adapters or {}).items():
+        session.mount(prefix, adapter)
+    return session
+
+
+# Shared by the examples that only issue requests, so connections to
+# httpbin.org carry over from one example to the next. Examples that
+# reconfigure retries, adapters or auth build their own session instead.
+# HTTPS goes over HTTP/2 when h2 is installed so same-host requests can share
+# a connection.
+_SESSION = _build_session(
+    max_retries=3,
+    timeout=(3.05, 30),
+    http_version="2" if HTTP2_AVAILABLE else "1.1",
+)
+atexit.register(_SESSION.close)
+
+# Per-host protocol overrides keyed by URL prefix, mounted once at import
+_PROTOCOL_ADAPTERS = {}
+if HTTP2_AVAILABLE:
+    _PROTOCOL_ADAPTERS["https://www.google.com"] = HTTP2Adapter()
+if HTTP3_AVAILABLE:
+    _PROTOCOL_ADAPTERS["https://quic.tech"] = HTTP3Adapter()
+
+_MULTI_PROTOCOL_SESSION = _build_session(adapters=_PROTOCOL_ADAPTERS)
+atexit.register(_MULTI_PROTOCOL_SESSION.close)
+
+
+def _status_only(session, url):
+    """GET a URL for its status code without buffering the body in memory."""
+    with session.get(url, stream=True) as response:
+        # Closing an unread streamed response drops its socket, so drain the
+        # body in chunks to let the connection go back to the pool
+        for _ in response.iter_content(chunk_size=64 * 1024):
+            pass
+        return response.status_code
+
+
+def _hammer(session, urls, n):
+    """
+    Issue ``n`` GETs round-robin over ``urls`` through a thread pool.
+
+    At most two requests per worker are in flight at once, so memory stays
+    constant however large ``n`` grows. Yields (url, status_code) in order.
+    """
+    max_workers = len(urls)
+    fetch = partial(_status_only, session)
+    pending = deque()
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for url in islice(cycle(urls), n):
+            if len(pending) >= max_workers * 2:
+                done_url, future = pending.popleft()
+                yield done_url, future.result()
+            pending.append((url, executor.submit(fetch, url)))
+
+        while pending:
+            done_url, future = pending.popleft()
+            yield done_url, future.result()
+
+
+def connection_pooling_example(session=_SESSION):
     """Example: Configure connection pooling for better performance."""
     print("=== Connection Pooling Example ===")
 
-    # Create session with retry configuration
-    from urllib3.util.retry import Retry
-
-    retry = Retry(total=3)
-
-    # Create session with standard parameters
-    session = Session(
-        retry_config=retry, max_retries=3, timeout=(3.05, 30), http_version="1.1"
-    )
-
-    print("Note: Connection pooling is handled internally by requests")
-
     # Make multiple requests to demonstrate connection reuse
     urls = [
         "https://httpbin.org/get",
@@ -40,13 +146,14 @@ def connection_pooling_example():
     ]
 
     print("Making multiple requests with connection pooling...")
-    start_time = time.time()
+    start_time = time.perf_counter_ns()
 
-    for i, url in enumerate(urls * 3):  # Repeat URLs to show reuse
-        response = session.get(url)
-        print(f"Request {i+1}: {response.status_code} - {url}")
+    # Requests are independent, so run them concurrently over the shared pool,
+    # cycling through the URLs three times to show reuse
+    for i, (url, status) in enumerate(_hammer(session, urls, 9)):
+        print(f"Request {i+1}: {status} - {url}")
 
-    elapsed = time.time() - start_time
+    elapsed = (time.perf_counter_ns() - start_time) / 1e9
     print(f"Total time for 9 requests: {elapsed:.2f} seconds")
     print("(Connection pooling reduces overhead by reusing connections)")
 
@@ -64,12 +171,8 @@ def custom_retry_strategy_example():
         respect_retry_after_header=True,  # Respect Retry-After header
     )
 
-    # Create session with custom retry
-    session = Session()
-
-    # Apply custom retry to HTTP adapter
-    adapter = session.get_adapter("https://")
-    adapter.max_retries = custom_retry
+    # Create session with custom retry applied to its adapters at construction
+    session = _build_session(retry_config=custom_retry)
 
     print("Testing custom retry strategy...")
     try:
@@ -80,19 +183,12 @@ def custom_retry_strategy_example():
         print(f"Failed even after custom retries: {e}")
 
 
-def multi_protocol_session_example():
+def multi_protocol_session_example(session=_MULTI_PROTOCOL_SESSION):
     """Example: Use different HTTP protocols in the same session."""
     print("\n=== Multi-Protocol Session Example ===")
 
-    session = Session()
-
-    # Mount different adapters for different protocols
-    http2_adapter = HTTP2Adapter()
-    session.mount("https://www.google.com", http2_adapter)
-
-    if HTTP3_AVAILABLE:
-        http3_adapter = HTTP3Adapter()
-        session.mount("https://quic.tech", http3_adapter)
+    # Adapters for different protocols were mounted when the session was built
+    if "https://quic.tech" in session.adapters:
         print("HTTP/3 adapter mounted for quic.tech")
     else:
         print("HTTP/3 not available, using HTTP/2 fallback")
@@ -115,12 +211,10 @@ def multi_protocol_session_example():
             print(f"Error: {e}")
 
 
-def session_cookie_management_example():
+def session_cookie_management_example(session=_SESSION):
     """Example: Managing cookies across requests."""
     print("\n=== Cookie Management Example ===")
 
-    session = Session()
-
     # Set initial cookies
     session.cookies.set("session_id", "abc123", domain=".httpbin.org")
     session.cookies.set("user_pref", "dark_mode", domain=".httpbin.org")
@@ -140,7 +234,7 @@ def session_cookie_management_example():
     # Verify cookies are sent in subsequent requests
     print("\nVerifying cookies in next request...")
     response = session.get("https://httpbin.org/cookies")
-    cookies_received = response.json()["cookies"]
+    cookies_received = _loads(response)["cookies"]
     print("Server received cookies:", cookies_received)
 
 
@@ -153,16 +247,11 @@ def session_persistence_example():
 
     retry = Retry(total=2)
 
-    session = Session(retry_config=retry, timeout=(3.05, 30))
-    session.headers.update(
-        {
-            "User-Agent": "MyApp/1.0",
-            "Accept": "application/json",
-            "X-API-Version": "2.0",
-        },
+    session = _build_session(
+        retry_config=retry, timeout=(3.05, 30), headers=_PERSISTENT_HEADERS
     )
 
-    # Add authentication
+    # Add authentication once; every request below reuses it
     session.auth = ("username", "password")  # Basic auth example
 
     print("Base session configuration:")
@@ -189,10 +278,9 @@ def context_manager_example():
     print("Using session as context manager ensures proper cleanup...")
 
     # Session is automatically closed when exiting the context
-    with Session(max_retries=2, timeout=5) as session:
-        # Configure session
-        session.headers.update({"X-Session-Type": "Temporary"})
-
+    with _build_session(
+        max_retries=2, timeout=5, headers={"X-Session-Type": "Temporary"}
+    ) as session:
         # Make requests
         response = session.get("https://httpbin.org/headers")
         headers = response.json()["headers"]
@@ -208,34 +296,94 @@ def performance_monitoring_example():
     from urllib3.util.retry import Retry
 
     retry = Retry(total=1)
-    session = Session(retry_config=retry, timeout=(3.05, 30))
+    session = _build_session(retry_config=retry, timeout=(3.05, 30))
 
     # Add timing to requests
+    # perf_counter_ns is monotonic and integer-valued, so short intervals are
+    # neither skewed by clock adjustments nor rounded by float subtraction.
+    # Streaming returns once headers arrive, so this is time-to-first-byte.
     def time_request(session, url):
-        start = time.time()
-        response = session.get(url)
-        elapsed = time.time() - start
-        return elapsed, response.status_code
+        start = time.perf_counter_ns()
+        with session.get(url, stream=True) as response:
+            elapsed = (time.perf_counter_ns() - start) / 1e9
+            for _ in response.iter_content(chunk_size=64 * 1024):
+                pass  # Drain so the connection is reused by the next request
+            return elapsed, response.status_code
 
     # Make multiple requests to same host
     print("Testing connection reuse performance...")
     url = "https://httpbin.org/delay/0"
 
-    times = []
-    for i in range(5):
-        elapsed, status = time_request(session, url)
-        times.append(elapsed)
+    # Collect first and report afterwards so printing doesn't run between
+    # the timed requests
+    batch_start = time.perf_counter_ns()
+    samples = [time_request(session, url) for _ in range(5)]
+    serial_total = (time.perf_counter_ns() - batch_start) / 1e9
+    for i, (elapsed, status) in enumerate(samples):
         print(f"Request {i+1}: {elapsed:.3f}s (Status: {status})")
 
+    times = [elapsed for elapsed, _ in samples]
+
     print(f"\nAverage time: {sum(times)/len(times):.3f}s")
     print(f"First request: {times[0]:.3f}s (includes connection setup)")
     print(f"Subsequent avg: {sum(times[1:])/len(times[1:]):.3f}s (reuses connection)")
 
+    return serial_total
+
+
+async def performance_monitoring_example_async(serial_total=None):
+    """
+    Example: Issue the same requests concurrently on one event loop.
+
+    Serial timings mostly reflect the server's own variance. Overlapping the
+    requests on one thread, multiplexed over a single HTTP/2 connection when
+    h2 is installed, shows what connection reuse buys under load.
+
+    Args:
+        serial_total: Total seconds taken by the serial example, for contrast
+
+    Returns:
+        Total seconds for the concurrent batch, or None if httpx is missing
+    """
+    print("\n=== Async Performance Monitoring Example ===")
+
+    if not HTTPX_AVAILABLE:
+        print("httpx not installed, skipping (pip install httpx[http2])")
+        return None
+
+    url = "https://httpbin.org/delay/0"
+    limits = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+
+    async with httpx.AsyncClient(
+        limits=limits, http2=HTTP2_AVAILABLE, timeout=30
+    ) as client:
+
+        async def time_request():
+            start = time.perf_counter_ns()
+            response = await client.get(url)
+            return (time.perf_counter_ns() - start) / 1e9, response
+
+        start = time.perf_counter_ns()
+        samples = await asyncio.gather(*(time_request() for _ in range(5)))
+        total = (time.perf_counter_ns() - start) / 1e9
+
+    for i, (elapsed, response) in enumerate(samples):
+        print(
+            f"Request {i+1}: {elapsed:.3f}s "
+            f"(Status: {response.status_code}, {response.http_version})"
+        )
+
+    print(f"\nConcurrent total: {total:.3f}s")
+    if serial_total:
+        print(f"Serial total: {serial_total:.3f}s ({serial_total / total:.1f}x)")
+
+    return total
+
 
 def main():
     """Run all advanced session examples."""
     print("requests-enhanced Advanced Session Examples")
-    print("=" * 50)
+    print(_BANNER)
 
     connection_pooling_example()
     custom_retry_strategy_example()
@@ -243,9 +391,10 @@ def main():
     session_cookie_management_example()
     session_persistence_example()
     context_manager_example()
-    performance_monitoring_example()
+    serial_total = performance_monitoring_example()
+    asyncio.run(performance_monitoring_example_async(serial_total))
 
-    print("\n" + "=" * 50)
+    print("\n" + _BANNER)
     print("Advanced examples completed!")
 
 
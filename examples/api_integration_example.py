@@ -6,31 +6,93 @@ This example demonstrates how to use requests-enhanced for common API integratio
 patterns including authentication, pagination, and error handling.
 """
 
-import json
+import atexit
 import os
-from requests_enhanced import Session
-from requests_enhanced.exceptions import RequestRetryError, RequestTimeoutError
-
-
-def github_api_example():
+import socket
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+from requests.structures import CaseInsensitiveDict
+from requests_enhanced import Session, HTTP2_AVAILABLE, __version__
+from requests_enhanced.exceptions import (
+    RequestsEnhancedError,
+    RequestRetryError,
+    RequestTimeoutError,
+)
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+
+from _common import POOL_KW, _dumps, _loads
+
+# Section rule printed around each script's output
+_BANNER = "=" * 50
+
+# Static CRUD payloads, serialized once rather than by requests on every call
+_JSON_HEADERS = {"Content-Type": "application/json"}
+_NEW_POST_BODY = _dumps(
+    {
+        "title": "Test Post from requests-enhanced",
+        "body": "This is a test post using requests-enhanced library",
+        "userId": 1,
+    }
+)
+_UPDATED_POST_BODY = _dumps({"title": "Updated Title"})
+
+# Ask for compressed, kept-alive responses on every session. urllib3's
+# ACCEPT_ENCODING includes "br" only when a Brotli decoder is installed
+# (pip install requests-enhanced[brotli]), so every body it asks for decodes.
+_WIRE_HEADERS = CaseInsensitiveDict(
+    {"Accept-Encoding": ACCEPT_ENCODING, "Connection": "keep-alive"}
+)
+
+# Built once as a CaseInsensitiveDict so applying it to a session is a copy
+# rather than a fresh key normalisation of a dict literal
+_CUSTOM_HEADERS = CaseInsensitiveDict(
+    {
+        "User-Agent": f"requests-enhanced/{__version__}",
+        "Accept": "application/json",
+        "X-Custom-Header": "CustomValue",
+    }
+)
+
+# Retry policy shared by every session in this module. Retry objects are
+# immutable, so one instance can back both the HTTP and HTTPS adapters.
+_DEFAULT_RETRY = Retry(
+    total=3,
+    backoff_factor=0.5,
+    status_forcelist=(500, 502, 503, 504),
+    allowed_methods=frozenset({"GET", "POST", "PUT", "PATCH", "DELETE"}),
+    respect_retry_after_header=True,
+)
+
+# Reused across examples so each API host only pays for its TCP/TLS setup once,
+# negotiating HTTP/2 for HTTPS hosts when the h2 extra is installed
+_SESSION = Session(
+    retry_config=_DEFAULT_RETRY,
+    timeout=(3.05, 30),
+    http_version="2" if HTTP2_AVAILABLE else "1.1",
+    **POOL_KW,
+)
+_SESSION.headers.update(_WIRE_HEADERS)
+atexit.register(_SESSION.close)
+
+
+def github_api_example(session=_SESSION):
     """Example: Interacting with GitHub API."""
     print("=== GitHub API Example ===")
 
-    # Create a session with automatic retries
-    from urllib3.util.retry import Retry
-
-    retry = Retry(total=3, backoff_factor=0.5)
-    session = Session(retry_config=retry, timeout=(3.05, 30))
-
-    # Optional: Add authentication if you have a token
+    # Optional: Add authentication if you have a token. It is sent per request
+    # so the shared session never forwards it to other hosts.
+    headers = {}
     github_token = os.getenv("GITHUB_TOKEN")
     if github_token:
-        session.headers.update({"Authorization": f"token {github_token}"})
+        headers["Authorization"] = f"token {github_token}"
 
     try:
         # Get information about a repository
-        response = session.get("https://api.github.com/repos/python/cpython")
-        repo_data = response.json()
+        with session.get(
+            "https://api.github.com/repos/python/cpython", headers=headers
+        ) as response:
+            repo_data = _loads(response)
 
         print(f"Repository: {repo_data['full_name']}")
         print(f"Stars: {repo_data['stargazers_count']:,}")
@@ -43,83 +105,87 @@ def github_api_example():
         print(f"Request timed out: {e}")
 
 
-def paginated_api_example():
+def paginated_api_example(session=_SESSION):
     """Example: Handling paginated API responses."""
     print("\n=== Paginated API Example ===")
 
-    session = Session(max_retries=2, timeout=10)
+    max_pages = 3  # Limit for this example
 
     # Example: Get multiple pages of GitHub users
     all_users = []
-    page = 1
-    max_pages = 3  # Limit for this example
 
-    while page <= max_pages:
-        try:
-            response = session.get(
-                "https://api.github.com/users",
-                params={"per_page": 10, "since": page * 10},
-            )
-            users = response.json()
+    # GitHub returns the next page's URL in the Link header, which is available
+    # as soon as the headers arrive. Keep that request in flight while decoding
+    # the current page so JSON parsing overlaps the next round trip.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        future = executor.submit(
+            session.get, "https://api.github.com/users", params={"per_page": 10}
+        )
+
+        for page in range(1, max_pages + 1):
+            try:
+                response = future.result()
+
+                # response.links is requests' parse_header_links() of the Link
+                # header
+                next_url = response.links.get("next", {}).get("url")
+                future = None
+                if next_url and page < max_pages:
+                    future = executor.submit(session.get, next_url)
+
+                # Release the connection as soon as the body is decoded; a
+                # non-JSON body (e.g. an HTML rate-limit page) fails here
+                with response:
+                    users = _loads(response)
+            except Exception as e:
+                print(f"Error fetching page {page}: {e}")
+                break
 
             if not users:
                 break
 
             all_users.extend(users)
             print(f"Fetched page {page}: {len(users)} users")
-            page += 1
 
-        except Exception as e:
-            print(f"Error fetching page {page}: {e}")
-            break
+            if future is None:
+                break
 
     print(f"Total users fetched: {len(all_users)}")
     print(f"First user: {all_users[0]['login'] if all_users else 'None'}")
 
 
-def rest_api_crud_example():
+def rest_api_crud_example(session=_SESSION):
     """Example: CRUD operations with a REST API."""
     print("\n=== REST API CRUD Example ===")
 
     # Using JSONPlaceholder as a test API
     base_url = "https://jsonplaceholder.typicode.com"
-    from urllib3.util.retry import Retry
-
-    retry = Retry(
-        total=3,
-        backoff_factor=0.5,
-        status_forcelist=[500, 502, 503, 504],  # Retry on server errors
-    )
-    session = Session(retry_config=retry, timeout=10)
-
-    # CREATE - Post a new resource
-    new_post = {
-        "title": "Test Post from requests-enhanced",
-        "body": "This is a test post using requests-enhanced library",
-        "userId": 1,
-    }
+    posts_url = f"{base_url}/posts"
+    post_1_url = f"{posts_url}/1"
 
     try:
+        # CREATE - Post a new resource
         print("Creating new post...")
-        response = session.post(f"{base_url}/posts", json=new_post)
-        created_post = response.json()
+        response = session.post(posts_url, data=_NEW_POST_BODY, headers=_JSON_HEADERS)
+        created_post = _loads(response)
         print(f"Created post with ID: {created_post['id']}")
 
         # READ - Get the post
         print("\nReading post...")
-        response = session.get(f"{base_url}/posts/1")
-        post = response.json()
+        response = session.get(post_1_url)
+        post = _loads(response)
         print(f"Post title: {post['title']}")
 
         # UPDATE - Modify the post
         print("\nUpdating post...")
-        updated_data = {"title": "Updated Title"}
-        response = session.patch(f"{base_url}/posts/1", json=updated_data)
+        response = session.patch(
+            post_1_url, data=_UPDATED_POST_BODY, headers=_JSON_HEADERS
+        )
         print(f"Update status code: {response.status_code}")
 
         # DELETE - Remove the post
         print("\nDeleting post...")
-        response = session.delete(f"{base_url}/posts/1")
+        response = session.delete(post_1_url)
         print(f"Delete status code: {response.status_code}")
 
     except RequestRetryError as e:
@@ -130,38 +196,67 @@ def api_with_custom_headers():
     """Example: Using custom headers and authentication."""
     print("\n=== Custom Headers Example ===")
 
-    session = Session(max_retries=2)
+    session = Session(max_retries=2, **POOL_KW)
 
     # Add custom headers
-    session.headers.update(
-        {
-            "User-Agent": "requests-enhanced/1.0.1",
-            "Accept": "application/json",
-            "X-Custom-Header": "CustomValue",
-        }
-    )
+    session.headers.update(_WIRE_HEADERS)
+    session.headers.update(_CUSTOM_HEADERS)
 
     # Example: httpbin.org echo service
     try:
         response = session.get("https://httpbin.org/headers")
-        headers_echo = response.json()
+        headers_echo = _loads(response)
 
         print("Headers sent to server:")
         for key, value in headers_echo["headers"].items():
             print(f"  {key}: {value}")
 
+        # urllib3 has already decoded the body; this is the wire encoding
+        encoding = response.headers.get("Content-Encoding", "identity")
+        print(f"Response Content-Encoding: {encoding}")
+
     except Exception as e:
         print(f"Error: {e}")
 
 
-def error_handling_example():
+# Connection failures (DNS, refused) are not retried: they rarely heal within a
+# backoff window, while 5xx responses still get the usual retries
+_NO_CONNECT_RETRY = _DEFAULT_RETRY.new(connect=0)
+
+# Hosts already looked up in this run, mapped to whether they resolved
+_dns_cache = {}
+
+
+class UnrecoverableDNSError(RequestsEnhancedError):
+    """Raised when a URL's host does not resolve, so a retry cannot succeed."""
+
+
+def _check_resolvable(url):
+    """
+    Fail fast if the URL's host has no DNS record.
+
+    Resolution results are cached per host, so repeat calls are free.
+
+    Raises:
+        UnrecoverableDNSError: If the host cannot be resolved
+    """
+    host = urlparse(url).hostname
+    if host not in _dns_cache:
+        try:
+            socket.getaddrinfo(host, None)
+            _dns_cache[host] = True
+        except socket.gaierror:
+            _dns_cache[host] = False
+
+    if not _dns_cache[host]:
+        raise UnrecoverableDNSError(f"Cannot resolve host {host} for {url}")
+
+
+def error_handling_example(retry_config=_NO_CONNECT_RETRY):
     """Example: Comprehensive error handling."""
     print("\n=== Error Handling Example ===")
 
-    from urllib3.util.retry import Retry
-
-    retry = Retry(total=2, backoff_factor=1.0)
-    session = Session(retry_config=retry, timeout=5)
+    session = Session(retry_config=retry_config, timeout=5, **POOL_KW)
 
     # Test different error scenarios
     test_urls = [
@@ -175,13 +270,17 @@ def error_handling_example():
         print(f"URL: {url}")
 
         try:
+            _check_resolvable(url)
             response = session.get(url)
             print(f"Success! Status code: {response.status_code}")
+        except UnrecoverableDNSError as e:
+            print("DNS error: Host does not resolve, not retrying")
+            print(f"Details: {e}")
         except RequestTimeoutError as e:
             print(f"Timeout error: Request took too long")
             print(f"Details: {e}")
         except RequestRetryError as e:
-            print(f"Retry error: Failed after {session.max_retries} attempts")
+            print(f"Retry error: Failed after {retry_config.total} attempts")
             print(f"Details: {e}")
         except Exception as e:
             print(f"Unexpected error: {type(e).__name__}")
@@ -191,7 +290,7 @@ def error_handling_example():
 def main():
     """Run all API integration examples."""
     print("requests-enhanced API Integration Examples")
-    print("=" * 50)
+    print(_BANNER)
 
     # Run examples
     github_api_example()
@@ -200,7 +299,7 @@ def main():
     api_with_custom_headers()
     error_handling_example()
 
-    print("\n" + "=" * 50)
+    print("\n" + _BANNER)
     print("Examples completed!")
 
 
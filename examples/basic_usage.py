@@ -2,15 +2,19 @@
 Basic usage examples for requests-enhanced library.
 """
 
+import atexit
+
 from requests_enhanced import Session
 from requests_enhanced.utils import json_get, json_post
 
+# One session with default retry and timeout settings, shared by every example
+# so connections to httpbin.org are reused instead of re-established
+_SESSION = Session(max_retries=3)
+atexit.register(_SESSION.close)
 
-def session_example() -> None:
-    """Example of using the Session class for HTTP requests."""
-    # Create a session with default retry and timeout settings
-    session = Session()
 
+def session_example(session: Session = _SESSION) -> None:
+    """Example of using the Session class for HTTP requests."""
     # Simple GET request
     response = session.get("https://httpbin.org/get")
     print(f"GET Response Status: {response.status_code}")
@@ -23,14 +27,16 @@ def session_example() -> None:
     print(f"POST Response Content: {response.json()}")
 
 
-def utility_example() -> None:
+def utility_example(session: Session = _SESSION) -> None:
     """Example of using utility functions for simpler requests."""
     # GET request with automatic JSON handling
-    get_data = json_get("https://httpbin.org/get?param=value")
+    get_data = json_get("https://httpbin.org/get?param=value", session=session)
     print(f"\nUtility GET Result: {get_data}")
 
     # POST request with automatic JSON handling
-    post_data = json_post("https://httpbin.org/post", data={"name": "example"})
+    post_data = json_post(
+        "https://httpbin.org/post", data={"name": "example"}, session=session
+    )
     print(f"Utility POST Result: {post_data}")
 
 
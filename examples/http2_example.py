@@ -6,15 +6,29 @@ for improved performance through connection multiplexing, header compression,
 and other HTTP/2 features.
 """
 
-from typing import Dict, Any
+import atexit
+from typing import Any, Dict
 
 from requests_enhanced import Session, HTTP2_AVAILABLE
 
+from _common import _fetch_all, _loads, _print_results
 
-def http2_session_example() -> Dict[str, Any]:
+# Shared HTTP/2 session (HTTP/1.1 when h2 is not installed), reused by callers
+# so the negotiated connection is not thrown away after each example
+_SESSION = Session(
+    http_version="2" if HTTP2_AVAILABLE else "1.1",
+    timeout=(5, 30),  # (connect_timeout, read_timeout)
+)
+atexit.register(_SESSION.close)
+
+
+def http2_session_example(session: Session = _SESSION) -> Dict[str, Any]:
     """
     Example of using HTTP/2 with the Session class.
 
+    Args:
+        session: Session to issue the request with
+
     Returns:
         Dict containing performance information and HTTP/2 availability
     """
@@ -22,28 +36,15 @@ def http2_session_example() -> Dict[str, Any]:
     if not HTTP2_AVAILABLE:
         print("HTTP/2 dependencies are not installed. Using HTTP/1.1 fallback.")
         print("Install HTTP/2 dependencies with: pip install requests-enhanced[http2]")
-
-        # Create a standard HTTP/1.1 session when HTTP/2 is not available
-        session = Session(http_version="1.1", timeout=(5, 30))
     else:
         print("HTTP/2 support is available and enabled.")
-        try:
-            # Create a session with HTTP/2 enabled
-            session = Session(
-                http_version="2",  # Request HTTP/2 protocol
-                timeout=(5, 30),  # (connect_timeout, read_timeout)
-            )
-        except Exception as e:
-            print(f"Error creating HTTP/2 session: {e}")
-            print("Falling back to HTTP/1.1")
-            session = Session(http_version="1.1", timeout=(5, 30))
 
     # Make a request to httpbin.org
     print("\nMaking request to httpbin.org...")
     try:
         response = session.get("https://httpbin.org/get?param=http2_test")
         print(f"Response status: {response.status_code}")
-        return response.json()
+        return _loads(response)
     except Exception as e:
         print(f"Error making request: {e}")
         return {"error": str(e)}
@@ -51,8 +52,6 @@ def http2_session_example() -> Dict[str, Any]:
 
 def compare_protocols() -> None:
     """Compare HTTP/1.1 and HTTP/2 with multiple requests."""
-    import time
-
     # URLs to test with - using httpbin as it supports both HTTP/1.1 and HTTP/2
     urls = [
         "https://httpbin.org/get?id=1",
@@ -65,17 +64,11 @@ def compare_protocols() -> None:
     # Test with HTTP/1.1
     print("\nTesting with HTTP/1.1:")
     try:
-        session_http1 = Session(http_version="1.1")
-        start_time = time.time()
-
-        for url in urls:
-            try:
-                response = session_http1.get(url)
-                print(f"Request to {url} completed with status {response.status_code}")
-            except Exception as e:
-                print(f"Error with HTTP/1.1 request to {url}: {e}")
-
-        http1_time = time.time() - start_time
+        session_http1 = Session(
+            http_version="1.1", pool_connections=len(urls), pool_maxsize=len(urls)
+        )
+        http1_time, results = _fetch_all(session_http1, urls)
+        _print_results(results, "HTTP/1.1")
         print(f"Total time for HTTP/1.1: {http1_time:.3f} seconds")
     except Exception as e:
         print(f"Error creating HTTP/1.1 session: {e}")
@@ -86,20 +79,12 @@ def compare_protocols() -> None:
     if HTTP2_AVAILABLE:
         print("\nTesting with HTTP/2:")
         try:
-            session_http2 = Session(http_version="2")
+            session_http2 = Session(
+                http_version="2", pool_connections=len(urls), pool_maxsize=len(urls)
+            )
             http2_session_created = True
-            start_time = time.time()
-
-            for url in urls:
-                try:
-                    response = session_http2.get(url)
-                    print(
-                        f"Request to {url} completed with status {response.status_code}"
-                    )
-                except Exception as e:
-                    print(f"Error with HTTP/2 request to {url}: {e}")
-
-            http2_time = time.time() - start_time
+            http2_time, results = _fetch_all(session_http2, urls)
+            _print_results(results, "HTTP/2")
             print(f"Total time for HTTP/2: {http2_time:.3f} seconds")
         except Exception as e:
             print(f"Error creating HTTP/2 session: {e}")
@@ -6,16 +6,30 @@ with automatic fallback to HTTP/2 and HTTP/1.1 if the server or dependencies
 don't support HTTP/3.
 """
 
-from typing import Dict, Any
+import atexit
+from typing import Any, Dict
 import time
 
 from requests_enhanced import Session, HTTP3_AVAILABLE, HTTP2_AVAILABLE
 
+from _common import _fetch_all, _print_results
 
-def http3_session_example() -> Dict[str, Any]:
+# Module-wide session with HTTP/3 requested; falls back automatically and keeps
+# its pooled connections for every caller
+_SESSION = Session(
+    http_version="3",  # Request HTTP/3 protocol with fallback
+    timeout=(5, 30),  # (connect_timeout, read_timeout)
+)
+atexit.register(_SESSION.close)
+
+
+def http3_session_example(session: Session = _SESSION) -> Dict[str, Any]:
     """
     Example of using HTTP/3 with automatic fallback mechanism.
 
+    Args:
+        session: Session to issue the requests with
+
     Returns:
         Dict containing performance information and protocol availability
     """
@@ -32,27 +46,21 @@ def http3_session_example() -> Dict[str, Any]:
         print("Install HTTP/3 dependencies with: pip install requests-enhanced[http3]")
 
     try:
-        # Create a session with HTTP/3 enabled and automatic fallback
-        session = Session(
-            http_version="3",  # Request HTTP/3 protocol with fallback
-            timeout=(5, 30),  # (connect_timeout, read_timeout)
-        )
-
-        print("\nCreated session with HTTP/3 requested (with automatic fallback)")
+        print("\nUsing session with HTTP/3 requested (with automatic fallback)")
 
         # Make a request to a site that supports HTTP/3
         print("\nMaking request to Cloudflare (supports HTTP/3)...")
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         response = session.get("https://cloudflare.com/")
-        cf_time = time.time() - start_time
+        cf_time = (time.perf_counter_ns() - start_time) / 1e9
         print(f"Response status: {response.status_code}")
         print(f"Request completed in {cf_time:.3f} seconds")
 
         # Make a request to httpbin (may not support HTTP/3)
         print("\nMaking request to httpbin.org...")
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         response = session.get("https://httpbin.org/get?param=http3_test")
-        httpbin_time = time.time() - start_time
+        httpbin_time = (time.perf_counter_ns() - start_time) / 1e9
         print(f"Response status: {response.status_code}")
         print(f"Request completed in {httpbin_time:.3f} seconds")
 
@@ -84,18 +92,13 @@ def compare_protocols() -> None:
     # Test with HTTP/1.1
     print("\nTesting with HTTP/1.1:")
     try:
-        session_http1 = Session(http_version="1.1")
+        session_http1 = Session(
+            http_version="1.1", pool_connections=len(urls), pool_maxsize=len(urls)
+        )
         protocols.append("1.1")
 
-        start_time = time.time()
-        for url in urls:
-            try:
-                response = session_http1.get(url)
-                print(f"Request to {url} completed with status {response.status_code}")
-            except Exception as e:
-                print(f"Error with HTTP/1.1 request to {url}: {e}")
-
-        http1_time = time.time() - start_time
+        http1_time, results = _fetch_all(session_http1, urls)
+        _print_results(results, "HTTP/1.1")
         times["1.1"] = http1_time
         print(f"Total time for HTTP/1.1: {http1_time:.3f} seconds")
     except Exception as e:
@@ -105,20 +108,13 @@ def compare_protocols() -> None:
     if HTTP2_AVAILABLE:
         print("\nTesting with HTTP/2:")
         try:
-            session_http2 = Session(http_version="2")
+            session_http2 = Session(
+                http_version="2", pool_connections=len(urls), pool_maxsize=len(urls)
+            )
             protocols.append("2")
 
-            start_time = time.time()
-            for url in urls:
-                try:
-                    response = session_http2.get(url)
-                    print(
-                        f"Request to {url} completed with status {response.status_code}"
-                    )
-                except Exception as e:
-                    print(f"Error with HTTP/2 request to {url}: {e}")
-
-            http2_time = time.time() - start_time
+            http2_time, results = _fetch_all(session_http2, urls)
+            _print_results(results, "HTTP/2")
             times["2"] = http2_time
             print(f"Total time for HTTP/2: {http2_time:.3f} seconds")
         except Exception as e:
@@ -131,20 +127,13 @@ def compare_protocols() -> None:
     if HTTP3_AVAILABLE:
         print("\nTesting with HTTP/3:")
         try:
-            session_http3 = Session(http_version="3")
+            session_http3 = Session(
+                http_version="3", pool_connections=len(urls), pool_maxsize=len(urls)
+            )
             protocols.append("3")
 
-            start_time = time.time()
-            for url in urls:
-                try:
-                    response = session_http3.get(url)
-                    print(
-                        f"Request to {url} completed with status {response.status_code}"
-                    )
-                except Exception as e:
-                    print(f"Error with HTTP/3 request to {url}: {e}")
-
-            http3_time = time.time() - start_time
+            http3_time, results = _fetch_all(session_http3, urls)
+            _print_results(results, "HTTP/3")
             times["3"] = http3_time
             print(f"Total time for HTTP/3: {http3_time:.3f} seconds")
         except Exception as e:
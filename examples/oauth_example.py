@@ -9,6 +9,8 @@ Requirements:
     pip install requests-enhanced[oauth]
 """
 
+import atexit
+import base64
 import os
 import json
 from pathlib import Path
@@ -27,6 +29,115 @@ except ImportError:
     exit(1)
 
 
+# Token files are small but rewritten on every refresh; orjson (pip install
+# orjson) serializes them in native code, with the stdlib json as fallback
+try:
+    import orjson
+
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+
+except ImportError:
+
+    def _dumps(obj):
+        return json.dumps(obj).encode("utf-8")
+
+    _loads = json.loads
+
+
+# Token storage locations, resolved once. The directory is created here rather
+# than before every save, so refreshes only touch the token file itself.
+_TOKEN_DIR = Path.home() / ".config" / "myapp"
+_TOKEN_FILE = _TOKEN_DIR / "github_token.json"
+_OAUTH_TOKEN_FILE = _TOKEN_DIR / "oauth_token.json"
+_TOKEN_DIR.mkdir(parents=True, exist_ok=True)
+
+
+def _write_token(path, token):
+    """
+    Write a token to ``path``, readable and writable by its owner only.
+
+    os.open creates a new file with 0o600 up front, so it is never briefly
+    readable by others. The mode only applies on creation, so fchmod also
+    tightens a file left by an older version before the token is written.
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    os.fchmod(fd, 0o600)
+    with os.fdopen(fd, "wb") as f:
+        f.write(_dumps(token))
+
+
+def _read_token(path):
+    """Read a token previously written by _write_token."""
+    with open(path, "rb") as f:
+        return _loads(f.read())
+
+
+# Token updaters passed to get_session. They live at module level so every
+# call hands over the same function object and the kwargs comparison holds.
+def save_token(token):
+    """Save token to secure storage"""
+    print(f"💾 Saving updated token: {token.get('access_token', 'N/A')[:10]}...")
+    # In practice: save to database, keychain, etc.
+    _write_token(_TOKEN_FILE, token)  # Secure permissions
+
+
+def secure_save_token(token):
+    """Save token with owner-only permissions"""
+    _write_token(_OAUTH_TOKEN_FILE, token)  # Owner read/write only
+    print("   ✅ Token saved with secure permissions")
+
+
+# Section rule printed around each script's output
+_BANNER = "=" * 50
+
+_GITHUB_TOKEN_URL = "https://github.com/login/oauth/access_token"
+_EXAMPLE_TOKEN_URL = "https://api.example.com/oauth/token"
+
+# OAuth 2.0 sessions shared between examples, keyed by (client_id, token
+# endpoint), so their connection pools and cached tokens outlive each example.
+# Each entry also records the kwargs the session was built with. A plain dict
+# rather than a WeakValueDictionary: the cache is what keeps the sessions alive
+# between calls, and owns them until the interpreter exits.
+_SESSION_CACHE = {}
+
+
+def get_session(client_id, token_endpoint, **kwargs):
+    """
+    Return the shared OAuth2EnhancedSession for a client and token endpoint.
+
+    The session is built with ``kwargs`` on first use. Later calls must pass
+    the same ``kwargs``, so callbacks such as ``token_updater`` should be
+    module-level functions rather than closures rebuilt on each call. The
+    session is shared and is closed at exit, so callers should not close it
+    themselves.
+
+    Raises:
+        ValueError: If the cached session was built with different ``kwargs``
+    """
+    key = (client_id, token_endpoint)
+    cached = _SESSION_CACHE.get(key)
+    if cached is None:
+        session = OAuth2EnhancedSession(client_id=client_id, **kwargs)
+        _SESSION_CACHE[key] = (session, kwargs)
+        return session
+
+    session, cached_kwargs = cached
+    if kwargs != cached_kwargs:
+        raise ValueError(
+            f"Session for {client_id!r} at {token_endpoint} already exists "
+            "with different settings"
+        )
+    return session
+
+
+@atexit.register
+def _close_sessions():
+    """Close every cached session when the interpreter exits."""
+    for session, _ in _SESSION_CACHE.values():
+        session.close()
+
+
 def oauth1_twitter_example():
     """
     Example: OAuth 1.0a with Twitter API
@@ -116,9 +227,10 @@ def oauth2_github_example():
         print("⚠️  Set GITHUB_CLIENT_ID and GITHUB_CLIENT_SECRET environment variables")
         print("   This example will show the OAuth flow without making real requests")
 
-    # Step 1: Create OAuth 2.0 session
-    session = OAuth2EnhancedSession(
-        client_id=client_id,
+    # Step 1: Get the (shared) OAuth 2.0 session
+    session = get_session(
+        client_id,
+        _GITHUB_TOKEN_URL,
         redirect_uri=redirect_uri,
         scope=["user", "repo"],
         # Enhanced features
@@ -148,7 +260,7 @@ def oauth2_github_example():
         if auth_response:
             print("🔄 Exchanging authorization code for token...")
             token = session.fetch_token(
-                "https://github.com/login/oauth/access_token",
+                _GITHUB_TOKEN_URL,
                 authorization_response=auth_response,
                 client_secret=client_secret,
             )
@@ -199,29 +311,18 @@ def oauth2_token_management_example():
     }
 
     # Token storage functions
-    def save_token(token):
-        """Save token to secure storage"""
-        print(f"💾 Saving updated token: {token.get('access_token', 'N/A')[:10]}...")
-        # In practice: save to database, keychain, etc.
-        token_file = Path.home() / ".config" / "myapp" / "github_token.json"
-        token_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(token_file, "w") as f:
-            json.dump(token, f)
-        os.chmod(token_file, 0o600)  # Secure permissions
-
     def load_token():
         """Load token from secure storage"""
-        token_file = Path.home() / ".config" / "myapp" / "github_token.json"
-        if token_file.exists():
-            with open(token_file, "r") as f:
-                return json.load(f)
+        if _TOKEN_FILE.exists():
+            return _read_token(_TOKEN_FILE)
         return None
 
     # Create session with automatic token refresh
-    session = OAuth2EnhancedSession(
-        client_id="your_client_id",
+    session = get_session(
+        "your_client_id",
+        _GITHUB_TOKEN_URL,
         token=existing_token,
-        auto_refresh_url="https://github.com/login/oauth/access_token",
+        auto_refresh_url=_GITHUB_TOKEN_URL,
         auto_refresh_kwargs={"client_secret": "your_client_secret"},
         token_updater=save_token,  # Automatically save refreshed tokens
     )
@@ -233,7 +334,7 @@ def oauth2_token_management_example():
     try:
         print("🔄 Manually refreshing token...")
         new_token = session.refresh_token(
-            "https://github.com/login/oauth/access_token",
+            _GITHUB_TOKEN_URL,
             client_secret="your_client_secret",
         )
         print("✅ Token refreshed successfully")
@@ -261,12 +362,12 @@ def oauth2_client_credentials_example():
     """
     print("\n=== OAuth 2.0 Client Credentials Flow ===")
 
-    session = OAuth2EnhancedSession(client_id="your_service_client_id")
+    session = get_session("your_service_client_id", _EXAMPLE_TOKEN_URL)
 
     try:
         print("🔄 Fetching token using client credentials...")
         token = session.fetch_token(
-            "https://api.example.com/oauth/token",
+            _EXAMPLE_TOKEN_URL,
             client_secret="your_service_client_secret",
             grant_type="client_credentials",
             scope=["api:read", "api:write"],
@@ -284,56 +385,78 @@ def oauth2_client_credentials_example():
         print("   This is expected without real service credentials")
 
 
-def oauth_error_handling_example():
+def oauth_error_handling_example(max_retries=3):
     """
     Example: Robust OAuth error handling
     """
     print("\n=== OAuth Error Handling ===")
 
-    from requests.exceptions import RequestException
+    from requests_enhanced.exceptions import RequestRetryError
+    from urllib3.util.retry import Retry
 
     try:
         from oauthlib.oauth2 import TokenExpiredError
-        from requests_oauthlib import TokenRequestDenied
+        from requests_oauthlib.oauth1_session import TokenRequestDenied
     except ImportError:
         print("⚠️  OAuth error classes not available")
         return
 
-    def make_robust_oauth_request(session, url, max_retries=3):
-        """Make OAuth request with comprehensive error handling"""
-        for attempt in range(max_retries):
-            try:
-                response = session.get(url)
-                response.raise_for_status()
-                return response.json()
-
-            except TokenExpiredError:
-                print(f"🔄 Token expired on attempt {attempt + 1}, refreshing...")
-                # Token will be automatically refreshed if auto_refresh_url is set
-                continue
-
-            except TokenRequestDenied as e:
-                print(f"❌ Token request denied: {e}")
-                raise
-
-            except RequestException as e:
-                if attempt == max_retries - 1:
-                    print(f"❌ Max retries exceeded: {e}")
-                    raise
-                print(f"⚠️  Request failed on attempt {attempt + 1}, retrying...")
-                continue
-
-        raise Exception("Request failed after all retries")
-
-    # Example usage
+    token_url = _EXAMPLE_TOKEN_URL
+
+    # Transient failures are retried by urllib3 inside the adapter, on the same
+    # pooled connection, instead of by a Python loop around session.get. 401 is
+    # not in the forcelist: the retried request would carry the same stale
+    # Authorization header, so it is handled by the hook below instead.
+    retry = Retry(
+        total=max_retries,
+        status_forcelist=frozenset({500, 502, 503, 504}),
+        backoff_factor=0.5,
+        respect_retry_after_header=True,
+    )
+
     session = OAuth2EnhancedSession(
         client_id="test_client",
         token={"access_token": "test_token", "token_type": "Bearer"},
+        auto_refresh_url=token_url,  # Expired tokens are refreshed before sending
+        retry_config=retry,
     )
 
+    def refresh_on_401(response, *args, **kwargs):
+        """Refresh the token once on 401 and resend with the new credentials."""
+        if response.status_code != 401:
+            return response
+
+        print("🔄 Access token rejected, refreshing...")
+        session.refresh_token(token_url)
+
+        # Drain the rejected response so its connection returns to the pool
+        response.content
+        response.close()
+
+        prep = response.request.copy()
+        prep.prepare_auth(session.auth)
+        retried = response.connection.send(prep, **kwargs)
+        retried.history.append(response)
+        retried.request = prep
+        return retried
+
+    session.hooks["response"].append(refresh_on_401)
+
     try:
-        result = make_robust_oauth_request(session, "https://api.example.com/data")
-        print("✅ Request successful")
+        response = session.get("https://api.example.com/data")
+        response.raise_for_status()
+        result = response.json()
+        print(f"✅ Request successful: {result}")
+
+    except TokenExpiredError:
+        print("❌ Token expired and no refresh URL is configured")
+
+    except TokenRequestDenied as e:
+        print(f"❌ Token request denied: {e}")
+
+    except RequestRetryError as e:
+        print(f"❌ Max retries exceeded: {e}")
+
     except Exception as e:
         print(f"❌ Request ultimately failed: {e}")
 
@@ -361,24 +484,17 @@ def oauth_best_practices_example():
 
     # 2. Secure token storage
     print("2. 💾 Secure token storage:")
-    token_dir = Path.home() / ".config" / "myapp"
-    token_file = token_dir / "oauth_token.json"
-
-    def secure_save_token(token):
-        token_dir.mkdir(parents=True, exist_ok=True)
-        with open(token_file, "w") as f:
-            json.dump(token, f)
-        os.chmod(token_file, 0o600)  # Owner read/write only
-        print("   ✅ Token saved with secure permissions")
 
     # 3. Session reuse and connection pooling
     print("3. 🔄 Session reuse and connection pooling:")
 
     class OAuthAPIClient:
         def __init__(self, client_id, client_secret):
-            self.session = OAuth2EnhancedSession(
-                client_id=client_id,
-                auto_refresh_url="https://api.example.com/oauth/token",
+            # One session per client and token endpoint for the whole process
+            self.session = get_session(
+                client_id,
+                _EXAMPLE_TOKEN_URL,
+                auto_refresh_url=_EXAMPLE_TOKEN_URL,
                 auto_refresh_kwargs={"client_secret": client_secret},
                 token_updater=secure_save_token,
                 # Enhanced features for production
@@ -388,26 +504,31 @@ def oauth_best_practices_example():
             )
 
             # Load existing token
-            if token_file.exists():
-                with open(token_file, "r") as f:
-                    self.session.token = json.load(f)
+            if _OAUTH_TOKEN_FILE.exists():
+                self.session.token = _read_token(_OAUTH_TOKEN_FILE)
 
         def get_user_data(self):
             return self.session.get("https://api.example.com/user").json()
 
         def close(self):
-            self.session.close()
+            # The session is shared through get_session and closed at exit,
+            # so only drop this client's reference to it
+            self.session = None
 
     print("   ✅ Reusable API client with automatic token management")
 
     # 4. State parameter for CSRF protection
     print("4. 🛡️  CSRF protection with state parameter:")
-    import secrets
+
+    def new_state():
+        # 32 bytes from the OS CSPRNG, URL-safe encoded (what secrets.token_urlsafe
+        # does). Swap in a buffered generator for high-volume authorization flows.
+        return base64.urlsafe_b64encode(os.urandom(32)).rstrip(b"=").decode("ascii")
 
     session = OAuth2EnhancedSession(
         client_id="test_client",
         redirect_uri="http://localhost:8080/callback",
-        state=secrets.token_urlsafe(32),  # Cryptographically secure random state
+        state_generator=new_state,  # Fresh random state for every authorization URL
     )
     print("   ✅ Secure random state generated for CSRF protection")
 
@@ -431,7 +552,7 @@ def oauth_best_practices_example():
 def main():
     """Run all OAuth examples"""
     print("🔐 OAuth Examples for requests-enhanced")
-    print("=" * 50)
+    print(_BANNER)
 
     if not OAUTH_AVAILABLE:
         print("❌ OAuth functionality not available")
@@ -3,6 +3,7 @@ Advanced retry and timeout handling examples for requests-enhanced library.
 """
 
 from typing import Dict, Any
+import atexit
 import logging
 import requests
 from requests.adapters import Retry
@@ -10,33 +11,41 @@ from requests_enhanced import Session
 from requests_enhanced.exceptions import RequestRetryError, RequestTimeoutError
 from requests_enhanced.logging import configure_logger
 
+# Custom retry configuration, built once. frozensets make urllib3's
+# per-response "status in status_forcelist" check a hash lookup.
+_RETRY = Retry(
+    total=3,  # Total number of retries
+    backoff_factor=0.5,  # Backoff factor between retries
+    status_forcelist=frozenset({500, 502, 503, 504}),  # Status codes to retry on
+    allowed_methods=frozenset({"GET", "POST"}),  # HTTP methods to retry
+    raise_on_status=False,  # Return the last response once retries run out
+)
+
+# Sessions are built once and reused, so repeated calls to the examples keep
+# their pooled connections to httpbin.org instead of reconnecting every time
+_RETRY_SESSION = Session(retry_config=_RETRY)
+atexit.register(_RETRY_SESSION.close)
+
+# Custom timeout (connect_timeout, read_timeout)
+_TIMEOUT_SESSION = Session(timeout=(1.5, 3))
+atexit.register(_TIMEOUT_SESSION.close)
+
 
 def configure_logging() -> None:
     """Configure the requests_enhanced logger for this example."""
-    logger = logging.getLogger("requests_enhanced")
-    # Configure with debug level and custom format
+    # Configure with debug level and custom format; with no logger given,
+    # configure_logger sets up the library's "requests_enhanced" logger
     configure_logger(
-        logger,
         level=logging.DEBUG,
         log_format="%(asctime)s - %(levelname)s - %(message)s",
     )
 
 
-def custom_retry_example() -> None:
+def custom_retry_example(session: Session = _RETRY_SESSION) -> None:
     """Example of using custom retry configuration."""
-    # Custom retry configuration
-    retry_config = Retry(
-        total=3,  # Total number of retries
-        backoff_factor=0.5,  # Backoff factor between retries
-        status_forcelist=[500, 502, 503, 504],  # Status codes to retry on
-        allowed_methods=["GET", "POST"],  # HTTP methods to retry
-    )
-
-    # Create session with custom retry configuration
-    session = Session(retry_config=retry_config)
-
     try:
-        # This endpoint will return 503 Service Unavailable
+        # This endpoint will return 503 Service Unavailable. With
+        # raise_on_status=False the final 503 is returned after the retries
         response = session.get("https://httpbin.org/status/503")
         print(f"Response status: {response.status_code}")
     except RequestRetryError as e:
@@ -44,11 +53,8 @@ def custom_retry_example() -> None:
         print(f"Original exception: {e.original_exception}")
 
 
-def timeout_example() -> Dict[str, Any]:
+def timeout_example(session: Session = _TIMEOUT_SESSION) -> Dict[str, Any]:
     """Example of handling timeouts with requests-enhanced."""
-    # Set custom timeout (connect_timeout, read_timeout)
-    session = Session(timeout=(1.5, 3))
-
     try:
         # This endpoint simulates a 10-second delay
         response = session.get("https://httpbin.org/delay/10")
@@ -5,51 +5,48 @@ Wrapper script to run examples in the correct Python environment.
 
 import os
 import sys
-import importlib.util
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+SRC_DIR = Path(__file__).parent / "src"
 
-def run_example(example_path):
-    """Run a single example file and capture its output."""
-    print(f"\n{'='*50}")
-    print(f"RUNNING EXAMPLE: {os.path.basename(example_path)}")
-    print(f"{'='*50}")
-
-    try:
-        # Get the module name from the file path
-        module_name = os.path.splitext(os.path.basename(example_path))[0]
-
-        # Load the module
-        spec = importlib.util.spec_from_file_location(module_name, example_path)
-        module = importlib.util.module_from_spec(spec)
-
-        # Add the src directory to sys.path temporarily
-        original_path = sys.path.copy()
-        sys.path.insert(0, str(Path(__file__).parent / "src"))
-
-        # Execute the module
-        spec.loader.exec_module(module)
-
-        # Restore the original path
-        sys.path = original_path
 
-        print(f"\n{'='*50}")
-        print(f"COMPLETED: {os.path.basename(example_path)}")
-        print(f"{'='*50}\n")
-
-    except Exception as e:
-        print(f"Error running {example_path}: {e}")
-        import traceback
-
-        traceback.print_exc()
+def run_example(example_path):
+    """
+    Run a single example file in a fresh interpreter and capture its output.
+
+    Each example gets its own process, so modules it imports and state it sets
+    up never leak into the examples that run after it.
+
+    Returns:
+        The completed process, with stdout and stderr combined
+    """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        filter(None, [str(SRC_DIR), env.get("PYTHONPATH")])
+    )
+
+    # stdin is closed so prompts in interactive examples fail fast instead of
+    # waiting on a terminal shared by several examples
+    return subprocess.run(
+        [sys.executable, str(example_path)],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        env=env,
+    )
 
 
 def main():
     """Run all example files in the examples directory."""
     # Find all Python files in the examples directory
     examples_dir = Path(__file__).parent / "examples"
-    example_files = list(examples_dir.glob("*.py"))
+    # Modules starting with "_" hold shared helpers rather than examples
+    example_files = sorted(
+        path for path in examples_dir.glob("*.py") if not path.name.startswith("_")
+    )
 
     if not example_files:
         print("No example files found in the examples directory.")
@@ -57,9 +54,24 @@ def main():
 
     print(f"Found {len(example_files)} example files.")
 
-    # Run each example
-    for example_file in example_files:
-        run_example(str(example_file))
+    # The examples spend their time waiting on the network, so run them side
+    # by side; threads are enough since the work happens in the subprocesses
+    with ThreadPoolExecutor(max_workers=min(8, len(example_files))) as executor:
+        results = executor.map(run_example, example_files)
+
+        # Report in file order, each example's output kept together
+        for example_file, result in zip(example_files, results):
+            print(f"\n{'='*50}")
+            print(f"RUNNING EXAMPLE: {example_file.name}")
+            print(f"{'='*50}")
+            print(result.stdout, end="")
+
+            if result.returncode != 0:
+                print(f"Error running {example_file}: exit code {result.returncode}")
+
+            print(f"\n{'='*50}")
+            print(f"COMPLETED: {example_file.name}")
+            print(f"{'='*50}\n")
 
 
 if __name__ == "__main__":
@@ -11,29 +11,62 @@ This library extends the requests package with features such as:
 - OAuth 1.0/1.1 and OAuth 2.0 authentication support
 """
 
-from typing import Optional, Type, Any
+from importlib.util import find_spec
+from typing import TYPE_CHECKING, Any, List
 
 from .sessions import Session
 from .adapters import HTTP2Adapter, HTTP3Adapter, HTTP2_AVAILABLE, HTTP3_AVAILABLE
 
-# OAuth support (optional dependency)
-try:
+# OAuth support (optional dependency). The .oauth module pulls in oauthlib and
+# requests-oauthlib, so it is only imported when one of these names is first
+# accessed (PEP 562) rather than on every ``import requests_enhanced``.
+_OAUTH_EXPORTS = (
+    "OAuth1EnhancedSession",
+    "OAuth2EnhancedSession",
+    "OAuthNotAvailableError",
+    "OAUTH_AVAILABLE",
+)
+
+if TYPE_CHECKING:
+    # Seen by type checkers only, so the OAuth exports keep their real types; at
+    # runtime they still resolve lazily through __getattr__ below
     from .oauth import (
+        OAUTH_AVAILABLE,
         OAuth1EnhancedSession,
         OAuth2EnhancedSession,
         OAuthNotAvailableError,
-        OAUTH_AVAILABLE,
     )
 
-    # If OAUTH_AVAILABLE is False, set classes to None for the test
-    if not OAUTH_AVAILABLE:
-        OAuth1EnhancedSession = None  # type: ignore  # noqa: F811
-        OAuth2EnhancedSession = None  # type: ignore  # noqa: F811
-except ImportError:
-    OAUTH_AVAILABLE = False
-    OAuth1EnhancedSession: Optional[Type[Any]] = None  # type: ignore
-    OAuth2EnhancedSession: Optional[Type[Any]] = None  # type: ignore
-    OAuthNotAvailableError: Optional[Type[Any]] = None  # type: ignore
+
+def __getattr__(name: str) -> Any:
+    """Import the OAuth module on first access to one of its exports."""
+    if name not in _OAUTH_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    if name == "OAUTH_AVAILABLE" and find_spec("requests_oauthlib") is None:
+        # Dependencies are missing, no need to import anything to say so
+        available = False
+    else:
+        from . import oauth
+
+        available = oauth.OAUTH_AVAILABLE
+        globals()["OAuthNotAvailableError"] = oauth.OAuthNotAvailableError
+        # The session classes are None when OAuth dependencies are unavailable
+        globals()["OAuth1EnhancedSession"] = (
+            oauth.OAuth1EnhancedSession if available else None
+        )
+        globals()["OAuth2EnhancedSession"] = (
+            oauth.OAuth2EnhancedSession if available else None
+        )
+
+    globals()["OAUTH_AVAILABLE"] = available
+    return globals()[name]
+
+
+def __dir__() -> List[str]:
+    """List module attributes, including OAuth exports not yet imported."""
+    return sorted(set(globals()) | set(_OAUTH_EXPORTS))
+
 
 __version__ = "1.0.1"
 __all__ = [
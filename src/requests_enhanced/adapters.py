@@ -10,7 +10,7 @@ import logging
 import re
 import ssl
 import requests
-from typing import Any, Mapping, Optional, Tuple, Union
+from typing import Any, Dict, Mapping, Optional, Tuple, Union
 
 from requests.adapters import HTTPAdapter
 from requests.packages.urllib3.connection import HTTPSConnection
@@ -18,8 +18,12 @@ from requests.packages.urllib3.connectionpool import (
     HTTPConnectionPool,
     HTTPSConnectionPool,
 )
-from requests.packages.urllib3.poolmanager import PoolManager
+from requests.packages.urllib3.poolmanager import SSL_KEYWORDS, PoolManager
 from requests.packages.urllib3.util.retry import Retry
+from requests.packages.urllib3.util.ssl_ import (
+    create_urllib3_context,
+    resolve_cert_reqs,
+)
 import urllib3
 
 # Check if HTTP/2 dependencies are available
@@ -203,9 +207,22 @@ class HTTP3ConnectionPool(HTTPSConnectionPool):
         return conn
 
 
+# Adapters spell their TLS floor as "TLSv1.2"-style names. urllib3 would read
+# these as ssl_version and pin that exact protocol (failing to resolve the name),
+# so connections turn them into a minimum version on their own SSL context.
+_MINIMUM_TLS_VERSIONS: Dict[Optional[str], ssl.TLSVersion] = {
+    "TLSv1.2": ssl.TLSVersion.TLSv1_2,
+    "TLSv1.3": ssl.TLSVersion.TLSv1_3,
+}
+
+
 class HTTP2Connection(HTTPSConnection):
     """A connection class that supports HTTP/2 protocol negotiation."""
 
+    # Set by HTTPSConnection and its pool; urllib3 1.x ships no type stubs
+    ssl_version: Optional[str]
+    ssl_context: Optional[ssl.SSLContext]
+
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         # Extract and store the protocol parameter before parent init
         protocol = kwargs.pop("protocol", "https")
@@ -223,6 +240,21 @@ class HTTP2Connection(HTTPSConnection):
     def connect(self) -> None:
         """Connect to the host and port specified in __init__."""
         try:
+            minimum_version = _MINIMUM_TLS_VERSIONS.get(self.ssl_version)
+            if minimum_version is not None:
+                self.ssl_version = None
+            if minimum_version is not None and self.ssl_context is None:
+                # A context per connection: urllib3 sets verify_mode on it for
+                # each connect, so it must not be shared across pools
+                context = create_urllib3_context(
+                    cert_reqs=resolve_cert_reqs(self.cert_reqs)
+                )
+                context.minimum_version = minimum_version
+                if not (self.ca_certs or self.ca_cert_dir or self.ca_cert_data):
+                    # urllib3 only loads these for contexts it creates itself
+                    context.load_default_certs()
+                self.ssl_context = context
+
             # Call the original connect method
             super().connect()
 
@@ -331,6 +363,37 @@ class HTTP2ConnectionPool(HTTPSConnectionPool):
                 raise
 
 
+def _pool_kwargs(
+    manager: PoolManager, scheme: str, request_context: Optional[dict]
+) -> dict:
+    """Build connection pool arguments the way PoolManager._new_pool does.
+
+    urllib3 hands the pool settings (maxsize, block, TLS options, ...) to
+    ``_new_pool`` as ``request_context``; overrides that drop it end up with
+    default-sized pools.
+
+    Args:
+        manager: Pool manager creating the pool.
+        scheme: URL scheme (http or https).
+        request_context: Pool settings from urllib3, if provided.
+
+    Returns:
+        Keyword arguments for the connection pool class.
+    """
+    if request_context is None:
+        request_context = manager.connection_pool_kw
+    kwargs = dict(request_context)
+
+    for key in ("scheme", "host", "port"):
+        kwargs.pop(key, None)
+
+    if scheme == "http":
+        for kw in SSL_KEYWORDS:
+            kwargs.pop(kw, None)
+
+    return kwargs
+
+
 class HTTP3PoolManager(PoolManager):
     """A pool manager for HTTP/3 connections with fallback capability."""
 
@@ -654,17 +717,22 @@ class HTTP3Adapter(HTTPAdapter):
                     self.protocol = protocol
 
                 def _new_pool(
-                    self, scheme: str, host: str, port: int, **kwargs: Any
+                    self,
+                    scheme: str,
+                    host: str,
+                    port: int,
+                    request_context: Optional[dict] = None,
                 ) -> Any:
                     """Create a new connection pool for HTTP or HTTPS."""
-                    # Add protocol to the kwargs
-                    kwargs["protocol"] = self.protocol
+                    kwargs = _pool_kwargs(self, scheme, request_context)
 
                     try:
                         # Create the appropriate pool type based on scheme
                         if scheme == "http":
                             return HTTPConnectionPool(host, port, **kwargs)
                         elif scheme == "https":
+                            # Only the HTTP/2 pool understands the protocol argument
+                            kwargs["protocol"] = self.protocol
                             return HTTP2ConnectionPool(host, port, **kwargs)
                     except TypeError as e:
                         # Handle errors by creating a basic pool
@@ -845,17 +913,22 @@ class HTTP2Adapter(HTTPAdapter):
                         self.protocol = protocol
 
                     def _new_pool(
-                        self, scheme: str, host: str, port: int, **kwargs: Any
+                        self,
+                        scheme: str,
+                        host: str,
+                        port: int,
+                        request_context: Optional[dict] = None,
                     ) -> Any:
                         """Create a new connection pool for HTTP or HTTPS."""
-                        # Add protocol to the kwargs
-                        kwargs["protocol"] = self.protocol
+                        kwargs = _pool_kwargs(self, scheme, request_context)
 
                         try:
                             # Create the appropriate pool type based on scheme
                             if scheme == "http":
                                 return HTTPConnectionPool(host, port, **kwargs)
                             elif scheme == "https":
+                                # Only the HTTP/2 pool understands the protocol argument
+                                kwargs["protocol"] = self.protocol
                                 return HTTP2ConnectionPool(host, port, **kwargs)
                         except TypeError as e:
                             # Handle errors by creating a basic pool
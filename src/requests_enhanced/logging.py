@@ -3,11 +3,18 @@ Logging configuration for requests-enhanced.
 """
 
 import logging
-from typing import Optional
+from typing import Dict, Optional
 
 # Default format for log messages
 DEFAULT_LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 
+# The library's logger, looked up once rather than on every configure call
+_LOG = logging.getLogger("requests_enhanced")
+
+# StreamHandlers created by configure_logger, keyed by logger name, so that
+# repeated calls reuse them instead of stacking duplicate handlers
+_DEFAULT_HANDLERS: Dict[str, logging.Handler] = {}
+
 
 class RequestsEnhancedFormatter(logging.Formatter):
     """Custom formatter for requests-enhanced logs."""
@@ -22,34 +29,58 @@ class RequestsEnhancedFormatter(logging.Formatter):
         if fmt is None:
             fmt = DEFAULT_LOG_FORMAT
         super().__init__(fmt=fmt)
+        # format() asks usesTime() for every record, but the answer only
+        # depends on the format string, so scan it once here
+        self._uses_time = super().usesTime()
+
+    def usesTime(self) -> bool:
+        """Return whether the format string references asctime."""
+        return self._uses_time
 
 
 def configure_logger(
-    logger: logging.Logger,
+    logger: Optional[logging.Logger] = None,
     level: int = logging.INFO,
     handler: Optional[logging.Handler] = None,
     log_format: Optional[str] = None,
+    propagate: Optional[bool] = None,
 ) -> logging.Logger:
     """
     Configure a logger with the specified level, handler, and format.
 
+    Calling this repeatedly is safe: the same handler is never added twice, and
+    the StreamHandler created when no handler is given is reused.
+
     Args:
-        logger: The logger to configure
+        logger: The logger to configure. If None, the "requests_enhanced" logger
+            is used.
         level: Logging level (e.g., logging.INFO, logging.DEBUG)
         handler: Optional handler to add to the logger. If None, a StreamHandler will be
             created.
         log_format: Format string for log messages. If None and handler has no
                    formatter, DEFAULT_LOG_FORMAT will be used.
+        propagate: Whether records should also be passed to ancestor loggers'
+            handlers. If None, a caller's logger is left as it is, while the
+            "requests_enhanced" logger stops propagating, since it now has its
+            own handler and would emit each record twice under a configured root.
 
     Returns:
         The configured logger
     """
+    if logger is None:
+        logger = _LOG
+    if propagate is None and logger is _LOG:
+        propagate = False
+
     # Set logger level
     logger.setLevel(level)
 
-    # Create handler if not provided
+    # Create handler if not provided, reusing one from an earlier call
     if handler is None:
-        handler = logging.StreamHandler()
+        handler = _DEFAULT_HANDLERS.get(logger.name)
+        if handler is None or handler not in logger.handlers:
+            handler = logging.StreamHandler()
+            _DEFAULT_HANDLERS[logger.name] = handler
         handler.setLevel(level)
 
     # Handle formatter based on provided log_format and existing formatter
@@ -67,4 +98,7 @@ def configure_logger(
     if handler not in logger.handlers:
         logger.addHandler(handler)
 
+    if propagate is not None:
+        logger.propagate = propagate
+
     return logger
@@ -6,8 +6,17 @@ with the enhanced Session class, supporting HTTP/2, HTTP/3, retry mechanisms,
 and enhanced logging.
 """
 
-from typing import Any, Dict, Optional, Tuple, Union, Callable
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, MutableMapping, Optional, Tuple, Union
 import logging
+import sys
+import threading
+import time
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.packages.urllib3.util.retry import Retry
 
 # Check for OAuth dependencies
 try:
@@ -38,6 +47,41 @@ from .exceptions import RequestsEnhancedError
 logger = logging.getLogger(__name__)
 
 
+def _token_adapters(
+    adapters: MutableMapping[str, BaseAdapter],
+) -> "OrderedDict[str, BaseAdapter]":
+    """
+    Build adapters for token requests that share the given adapters' pools.
+
+    Token endpoints are called with POST and often exchange single-use codes,
+    so a request that reached the server must not be replayed after a 5xx or
+    read error. Each returned adapter shares its original's connection pools
+    but retries with POST removed from the allowed methods; connect errors,
+    where nothing was sent, are still retried.
+
+    Args:
+        adapters: The enhanced session's mounted adapters
+
+    Returns:
+        Adapters to mount on the internal requests-oauthlib session
+    """
+    token_adapters: "OrderedDict[str, BaseAdapter]" = OrderedDict()
+    for prefix, adapter in adapters.items():
+        if isinstance(adapter, HTTPAdapter) and isinstance(adapter.max_retries, Retry):
+            retries = adapter.max_retries
+            # An empty allowed_methods means "any method" to urllib3
+            methods = retries.allowed_methods or Retry.DEFAULT_ALLOWED_METHODS
+            # copy.copy() would rebuild the pools through __setstate__
+            token_adapter = object.__new__(type(adapter))
+            token_adapter.__dict__.update(adapter.__dict__)
+            token_adapter.max_retries = retries.new(
+                allowed_methods=frozenset(methods) - {"POST"}
+            )
+            adapter = token_adapter
+        token_adapters[prefix] = adapter
+    return token_adapters
+
+
 class OAuthNotAvailableError(RequestsEnhancedError):
     """
     Raised when OAuth functionality is requested but dependencies are not
@@ -63,6 +107,71 @@ def _check_oauth_available() -> None:
         raise OAuthNotAvailableError()
 
 
+# Seconds before the server-side expiry at which a cached token counts as stale,
+# leaving room for clock skew and the request's own transit time
+_TOKEN_EXPIRY_SKEW = 30
+
+# Deadline for tokens without an expiry; monotonic_ns() will not reach it
+_NO_DEADLINE = sys.maxsize
+
+
+@dataclass
+class _TokenCache:
+    """
+    In-memory view of the current OAuth 2.0 token's lifetime.
+
+    Expiry is stored as a deadline on the monotonic nanosecond clock, computed
+    once when the token is set, so wall-clock adjustments cannot make a valid
+    token look expired and the per-request check is a single int comparison.
+    """
+
+    access_token: Optional[str]
+    refresh_token: Optional[str]
+    deadline_ns: int
+    scope: Optional[Union[str, list]]
+
+    @classmethod
+    def from_token(
+        cls, token: Dict[str, Any], skew: float = _TOKEN_EXPIRY_SKEW
+    ) -> "_TokenCache":
+        """
+        Build a cache entry from an OAuth 2.0 token dict.
+
+        An absolute ``expires_at`` (as stored by oauthlib) takes precedence over
+        ``expires_in``, which is stale for tokens reloaded from storage. Tokens
+        carrying neither never expire from the cache.
+
+        Args:
+            token: OAuth 2.0 token dict
+            skew: Seconds to subtract from the token's lifetime
+
+        Returns:
+            Cache entry for the token
+        """
+        if token.get("expires_at") is not None:
+            remaining: Optional[float] = float(token["expires_at"]) - time.time()
+        elif token.get("expires_in") is not None:
+            remaining = float(token["expires_in"])
+        else:
+            remaining = None
+
+        return cls(
+            access_token=token.get("access_token"),
+            refresh_token=token.get("refresh_token"),
+            deadline_ns=(
+                _NO_DEADLINE
+                if remaining is None
+                else time.monotonic_ns() + int((remaining - skew) * 1_000_000_000)
+            ),
+            scope=token.get("scope"),
+        )
+
+    @property
+    def expired(self) -> bool:
+        """Whether the token is past its (skewed) expiry time."""
+        return time.monotonic_ns() >= self.deadline_ns
+
+
 if OAUTH_AVAILABLE:
 
     class OAuth1EnhancedSession(Session):
@@ -157,6 +266,9 @@ if OAUTH_AVAILABLE:
                 client_class=client_class,
                 force_include_body=force_include_body,
             )
+            # Token requests reuse this session's pooled (already
+            # TLS-negotiated) connections to the provider
+            self._oauth_session.adapters = _token_adapters(self.adapters)
 
             # Set up OAuth authentication for all requests
             self.auth = OAuth1(
@@ -305,7 +417,8 @@ if OAUTH_AVAILABLE:
             redirect_uri: OAuth 2.0 redirect URI
             token: Current OAuth 2.0 token dict
             state: OAuth 2.0 state parameter
-            state_generator: Function to generate state parameter
+            state_generator: Function to generate the state parameter for each
+                authorization URL when no fixed ``state`` is given
             token_updater: Callback function to save updated tokens
             auto_refresh_url: URL for automatic token refresh
             auto_refresh_kwargs: Additional kwargs for token refresh
@@ -358,6 +471,10 @@ if OAUTH_AVAILABLE:
             self._auto_refresh_url = auto_refresh_url
             self._auto_refresh_kwargs = auto_refresh_kwargs or {}
             self._scope = scope
+            self._token_cache = _TokenCache.from_token(token) if token else None
+            # Serialises refreshes so concurrent requests on an expired token
+            # trigger a single round trip to the token endpoint
+            self._refresh_lock = threading.Lock()
 
             # Initialize the enhanced Session first
             # (only with Session-compatible kwargs)
@@ -368,12 +485,17 @@ if OAUTH_AVAILABLE:
                 client_id=client_id,
                 redirect_uri=redirect_uri,
                 token=token,
-                state=state,
+                # requests-oauthlib calls a callable state to mint a new value
+                # for each authorization URL
+                state=state or state_generator,
                 scope=scope,
                 auto_refresh_url=auto_refresh_url,
                 auto_refresh_kwargs=auto_refresh_kwargs,
                 token_updater=self._handle_token_update,
             )
+            # Token fetches and refreshes reuse this session's pooled (already
+            # TLS-negotiated) connections to the provider
+            self._oauth_session.adapters = _token_adapters(self.adapters)
 
             # Set up OAuth authentication if we have a token
             if token:
@@ -383,10 +505,19 @@ if OAUTH_AVAILABLE:
                 f"OAuth2EnhancedSession initialized with client_id: {client_id[:8]}..."
             )
 
+        def _store_token(self, token: Optional[Dict[str, Any]]) -> None:
+            """Record a new token, its auth handler and its cached expiry."""
+            self._token = token
+            if token:
+                self.auth = OAuth2(client_id=self._client_id, token=token)
+                self._token_cache = _TokenCache.from_token(token)
+            else:
+                self.auth = None
+                self._token_cache = None
+
         def _handle_token_update(self, token: Dict[str, Any]) -> None:
             """Handle token updates from automatic refresh."""
-            self._token = token
-            self.auth = OAuth2(client_id=self._client_id, token=token)
+            self._store_token(token)
 
             if self._token_updater:
                 self._token_updater(token)
@@ -485,8 +616,7 @@ if OAUTH_AVAILABLE:
             )
 
             # Update our token and auth
-            self._token = token
-            self.auth = OAuth2(client_id=self._client_id, token=token)
+            self._store_token(token)
 
             logger.info("OAuth 2.0 token fetched successfully")
             return token
@@ -542,12 +672,53 @@ if OAUTH_AVAILABLE:
             )
 
             # Update our token and auth
-            self._token = token
-            self.auth = OAuth2(client_id=self._client_id, token=token)
+            self._store_token(token)
 
             logger.info("OAuth 2.0 token refreshed successfully")
             return token
 
+        def _refresh_if_expired(self) -> None:
+            """
+            Refresh the cached token once it has expired.
+
+            Only tokens that are past their expiry are refreshed, and only when an
+            auto_refresh_url is configured. The refreshed token is handed to the
+            token_updater callback so callers can persist it.
+            """
+            cache = self._token_cache
+            if cache is None or not cache.expired or not self._auto_refresh_url:
+                return
+
+            with self._refresh_lock:
+                # Another thread may have refreshed while we waited for the lock
+                cache = self._token_cache
+                if cache is None or not cache.expired:
+                    return
+
+                logger.info("Cached OAuth 2.0 token expired, refreshing")
+                token = self.refresh_token(
+                    self._auto_refresh_url, **self._auto_refresh_kwargs
+                )
+                if self._token_updater:
+                    self._token_updater(token)
+
+        def request(  # type: ignore[override]
+            self, method: str, url: str, **kwargs: Any
+        ) -> requests.Response:
+            """
+            Send a request, refreshing the cached token first if it has expired.
+
+            Args:
+                method: HTTP method (e.g., 'GET', 'POST', 'PUT')
+                url: URL for the request
+                **kwargs: Additional arguments passed to Session.request
+
+            Returns:
+                Response object from the request
+            """
+            self._refresh_if_expired()
+            return super().request(method, url, **kwargs)
+
         @property
         def token(self) -> Optional[Dict[str, Any]]:
             """Get the current OAuth 2.0 token."""
@@ -556,11 +727,7 @@ if OAUTH_AVAILABLE:
         @token.setter
         def token(self, value: Optional[Dict[str, Any]]) -> None:
             """Set the OAuth 2.0 token."""
-            self._token = value
-            if value:
-                self.auth = OAuth2(client_id=self._client_id, token=value)
-            else:
-                self.auth = None
+            self._store_token(value)
 
 else:
     # When OAuth dependencies are not available, create placeholder classes
@@ -11,7 +11,7 @@ Typical usage example:
 """
 
 import logging
-from typing import Any, Literal, Optional, Tuple, Union
+from typing import Any, Dict, Literal, Optional, Tuple, Union
 
 import requests
 from requests import Session as RequestsSession
@@ -45,6 +45,9 @@ class Session(RequestsSession):
         timeout: Union[float, Tuple[float, float]] = (3.05, 30),
         max_retries: int = 3,
         http_version: Literal["1.1", "2", "3"] = "1.1",
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
     ) -> None:
         """
         Initialize a new Session with retry and timeout configuration.
@@ -55,6 +58,13 @@ class Session(RequestsSession):
                 or float value. Tuple recommended for precise control.
             max_retries: Number of retries for requests (used only if retry_config
                 is None). Must be a positive integer.
+            http_version: HTTP protocol version to use ('1.1', '2', or '3')
+            pool_connections: Number of urllib3 connection pools to cache
+                (one per host)
+            pool_maxsize: Maximum number of connections to keep per pool. Raise
+                this when issuing concurrent requests to the same host.
+            pool_block: Whether a saturated pool should block until a connection
+                is free instead of opening (and later discarding) extra ones
 
         Raises:
             ValueError: If max_retries is less than 1
@@ -74,6 +84,11 @@ class Session(RequestsSession):
         # Store HTTP version for reference
         self.http_version = http_version
 
+        # Connection pool sizing shared by all mounted adapters
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+
         # Configure retries
         if retry_config is None:
             # Reason: Create a default retry configuration with sensible defaults
@@ -102,16 +117,28 @@ class Session(RequestsSession):
         # Create a variable with Union type to handle different adapter types
         adapter: Union[HTTP3Adapter, HTTP2Adapter, HTTPAdapter]
 
+        # Reason: every adapter shares the session's pool sizing so concurrent
+        # callers don't serialize on urllib3's default of 10 connections
+        pool_kwargs: Dict[str, Any] = {
+            "pool_connections": self.pool_connections,
+            "pool_maxsize": self.pool_maxsize,
+            "pool_block": self.pool_block,
+        }
+
         # Determine which adapter to use based on HTTP version
         if http_version == "3":
             # Try HTTP/3 adapter
             if HTTP3_AVAILABLE:
                 # Use HTTP/3 adapter with automatic fallback
-                adapter = HTTP3Adapter(protocol_version="h3", max_retries=retry_config)
+                adapter = HTTP3Adapter(
+                    protocol_version="h3", max_retries=retry_config, **pool_kwargs
+                )
                 logger.debug("Using HTTP/3 adapter with fallback capability")
             elif HTTP2_AVAILABLE:
                 # Fall back to HTTP/2 if HTTP/3 dependencies aren't available
-                adapter = HTTP2Adapter(protocol_version="h2", max_retries=retry_config)
+                adapter = HTTP2Adapter(
+                    protocol_version="h2", max_retries=retry_config, **pool_kwargs
+                )
                 logger.warning(
                     "HTTP/3 requested but dependencies not available. "
                     "Falling back to HTTP/2. Install HTTP/3 with: "
@@ -119,7 +146,7 @@ class Session(RequestsSession):
                 )
             else:
                 # Final fallback to HTTP/1.1
-                adapter = HTTPAdapter(max_retries=retry_config)
+                adapter = HTTPAdapter(max_retries=retry_config, **pool_kwargs)
                 logger.warning(
                     "HTTP/3 and HTTP/2 dependencies not available. "
                     "Using HTTP/1.1 instead. Install with: "
@@ -130,11 +157,13 @@ class Session(RequestsSession):
             # Try HTTP/2 adapter
             if HTTP2_AVAILABLE:
                 # Use HTTP/2 adapter for HTTPS requests
-                adapter = HTTP2Adapter(protocol_version="h2", max_retries=retry_config)
+                adapter = HTTP2Adapter(
+                    protocol_version="h2", max_retries=retry_config, **pool_kwargs
+                )
                 logger.debug("Using HTTP/2 adapter for HTTPS connections")
             else:
                 # Fall back to HTTP/1.1
-                adapter = HTTPAdapter(max_retries=retry_config)
+                adapter = HTTPAdapter(max_retries=retry_config, **pool_kwargs)
                 logger.warning(
                     "HTTP/2 requested but dependencies not available. "
                     "Using HTTP/1.1 instead. Install with: "
@@ -142,14 +171,14 @@ class Session(RequestsSession):
                 )
         else:
             # Standard HTTP/1.1 adapter
-            adapter = HTTPAdapter(max_retries=retry_config)
+            adapter = HTTPAdapter(max_retries=retry_config, **pool_kwargs)
             logger.debug("Using standard HTTP/1.1 adapter")
 
         # Mount the appropriate adapter for HTTPS URLs (potentially HTTP/2 or HTTP/3)
         self.mount("https://", adapter)
 
         # Use standard adapter for HTTP connections (HTTP/1.1 only)
-        standard_adapter = HTTPAdapter(max_retries=retry_config)
+        standard_adapter = HTTPAdapter(max_retries=retry_config, **pool_kwargs)
         self.mount("http://", standard_adapter)
 
         logger.debug(
@@ -9,12 +9,17 @@ from pytest_httpserver import HTTPServer
 
 from requests_enhanced.logging import RequestsEnhancedFormatter, DEFAULT_LOG_FORMAT
 
+_LOG = logging.getLogger("requests_enhanced")
+
+# Formatters hold no per-record state, so one instance serves every fixture
+_FORMATTER = RequestsEnhancedFormatter(DEFAULT_LOG_FORMAT)
+
 
 @pytest.fixture
 def configuring_logger_for_tests():
     """Return a StringIO object that has been configured as a log handler."""
     log_stream = io.StringIO()
-    logger = logging.getLogger("requests_enhanced")
+    logger = _LOG
 
     # Save original handlers to restore later
     original_handlers = logger.handlers.copy()
@@ -25,8 +30,7 @@ def configuring_logger_for_tests():
 
     # Configure with a StreamHandler that writes to StringIO
     handler = logging.StreamHandler(log_stream)
-    formatter = RequestsEnhancedFormatter(DEFAULT_LOG_FORMAT)
-    handler.setFormatter(formatter)
+    handler.setFormatter(_FORMATTER)
     logger.addHandler(handler)
     logger.setLevel(logging.DEBUG)
 
@@ -43,16 +47,23 @@ def configuring_logger_for_tests():
 def stream_handler():
     """Return a StreamHandler already configured with RequestsEnhancedFormatter."""
     handler = logging.StreamHandler()
-    formatter = RequestsEnhancedFormatter(DEFAULT_LOG_FORMAT)
-    handler.setFormatter(formatter)
+    handler.setFormatter(_FORMATTER)
     return handler
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def http_server(request):
-    """Create and start an HTTP server for testing requests."""
+    """Create and start an HTTP server shared by every test in the session."""
     server = HTTPServer()
     server.start()
 
     request.addfinalizer(server.stop)
     return server
+
+
+@pytest.fixture(autouse=True)
+def http_server_reset(request):
+    """Clear the shared HTTP server's handlers and log before each test using it."""
+    # Looked up lazily so tests that don't need the server never start it
+    if "http_server" in request.fixturenames:
+        request.getfixturevalue("http_server").clear()
@@ -100,6 +100,12 @@ def test_formatter_custom_format():
     assert formatter._fmt == custom_format
 
 
+def test_formatter_uses_time():
+    """Test that the formatter reports whether its format includes asctime."""
+    assert RequestsEnhancedFormatter().usesTime() is True
+    assert RequestsEnhancedFormatter("%(levelname)s - %(message)s").usesTime() is False
+
+
 def test_logger_output():
     """Test that the logger outputs correctly formatted messages."""
     logger = logging.getLogger("test_output")
@@ -131,3 +137,52 @@ def test_multiple_handlers_not_duplicated():
     # Should only have one instance of the handler
     assert len(logger.handlers) == 1
     assert logger.handlers[0] is handler
+
+
+def test_configure_logger_reuses_default_handler():
+    """Test that repeated calls without a handler don't stack StreamHandlers."""
+    logger = logging.getLogger("test_idempotent")
+    logger.handlers.clear()
+
+    configure_logger(logger)
+    configure_logger(logger, level=logging.DEBUG)
+
+    assert len(logger.handlers) == 1
+    assert logger.handlers[0].level == logging.DEBUG
+
+
+def test_configure_logger_propagation():
+    """Test that a caller's logger only changes propagation when asked to."""
+    logger = logging.getLogger("test_propagate")
+    logger.handlers.clear()
+    logger.propagate = True
+
+    configure_logger(logger)
+    assert logger.propagate is True
+
+    configure_logger(logger, propagate=False)
+    assert logger.propagate is False
+
+    configure_logger(logger)
+    assert logger.propagate is False
+
+
+def test_configure_logger_defaults_to_library_logger():
+    """Test that with no logger given, the requests_enhanced logger is used."""
+    library_logger = logging.getLogger("requests_enhanced")
+    original_handlers = library_logger.handlers.copy()
+    original_level = library_logger.level
+    original_propagate = library_logger.propagate
+
+    try:
+        handler = logging.StreamHandler(io.StringIO())
+        result = configure_logger(handler=handler)
+
+        assert result is library_logger
+        assert handler in library_logger.handlers
+        # Has its own handler now, so records are not emitted twice
+        assert library_logger.propagate is False
+    finally:
+        library_logger.handlers[:] = original_handlers
+        library_logger.setLevel(original_level)
+        library_logger.propagate = original_propagate
@@ -2,73 +2,177 @@
 Tests for OAuth 1.0/1.1 and OAuth 2.0 integration in requests-enhanced.
 """
 
+import copy
+import importlib
+import importlib.util
+import subprocess
+import sys
+
 import pytest
-from unittest.mock import Mock, patch, MagicMock
-
-# Import OAuth functionality
-try:
-    from requests_enhanced import (
-        OAuth1EnhancedSession,
-        OAuth2EnhancedSession,
-        OAUTH_AVAILABLE,
-        OAuthNotAvailableError,
+from unittest.mock import Mock
+
+import requests_enhanced
+
+# Checked without importing anything, so collecting this module stays cheap
+# when the OAuth extra is missing
+OAUTH_TESTS_ENABLED = importlib.util.find_spec("requests_oauthlib") is not None
+
+# Shared skip markers for the test classes below
+requires_oauth = pytest.mark.skipif(
+    not OAUTH_TESTS_ENABLED, reason="OAuth dependencies not available"
+)
+without_oauth = pytest.mark.skipif(
+    OAUTH_TESTS_ENABLED, reason="OAuth dependencies are available"
+)
+
+
+@pytest.fixture(scope="session")
+def oauth():
+    """The requests_enhanced.oauth module, imported by the first test using it."""
+    return importlib.import_module("requests_enhanced.oauth")
+
+
+# Token payloads shared by the tests and the mock templates
+_REQUEST_TOKEN = {
+    "oauth_token": "request_token",
+    "oauth_token_secret": "request_secret",
+}
+_ACCESS_TOKEN = {"oauth_token": "access_token", "oauth_token_secret": "access_secret"}
+_BEARER = {
+    "access_token": "test_access_token",
+    "token_type": "Bearer",
+    "expires_in": 3600,
+}
+
+# Preconfigured stand-ins for requests-oauthlib's sessions, built once and
+# copied by the mock fixtures below. The fixtures patch per test rather than per
+# class because tests such as test_authorization_url_uses_state_generator rely
+# on the real requests-oauthlib sessions alongside the mocked ones.
+_OAUTH1_TEMPLATE = Mock()
+_OAUTH1_TEMPLATE.fetch_request_token.return_value = _REQUEST_TOKEN
+_OAUTH1_TEMPLATE.authorization_url.return_value = (
+    "https://api.example.com/oauth/authorize?oauth_token=test"
+)
+_OAUTH1_TEMPLATE.fetch_access_token.return_value = _ACCESS_TOKEN
+
+_OAUTH2_TEMPLATE = Mock()
+_OAUTH2_TEMPLATE.authorization_url.return_value = (
+    "https://api.example.com/oauth/authorize?client_id=test&state=random",
+    "random_state",
+)
+_OAUTH2_TEMPLATE.fetch_token.return_value = {
+    **_BEARER,
+    "refresh_token": "test_refresh_token",
+}
+_OAUTH2_TEMPLATE.refresh_token.return_value = {
+    "access_token": "new_access_token",
+    "token_type": "Bearer",
+    "expires_in": 3600,
+    "refresh_token": "new_refresh_token",
+}
+
+
+@pytest.fixture(scope="module")
+def base_oauth1_session(oauth):
+    """OAuth1 session shared by tests that only inspect its configuration."""
+    session = oauth.OAuth1EnhancedSession(
+        client_key="test_client_key", client_secret="test_client_secret"
+    )
+    yield session
+    session.close()
+
+
+@pytest.fixture(scope="module")
+def base_oauth2_session(oauth):
+    """OAuth2 session shared by tests that only inspect its configuration."""
+    session = oauth.OAuth2EnhancedSession(client_id="test_client_id")
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def fresh_oauth2(oauth):
+    """OAuth2 session with default arguments that a single test may mutate.
+
+    Tests patching the wrapped session should request oauth2_mock first, so the
+    mock is in place when this session is built.
+    """
+    session = oauth.OAuth2EnhancedSession(client_id="test_client_id")
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def oauth1_mock(monkeypatch):
+    """Patch OAuth1Session with a copy of the template for a single test."""
+    mock = copy.copy(_OAUTH1_TEMPLATE)
+    # The copy shares the template's child mocks, so clear calls made by earlier
+    # tests; configured return values survive the reset
+    mock.reset_mock()
+    # Token is a dict so the verifier can be stored by item assignment
+    mock.token = {}
+    monkeypatch.setattr(
+        "requests_enhanced.oauth._OAuth1Session", lambda *args, **kwargs: mock
     )
-    from requests_enhanced.oauth import _check_oauth_available
+    return mock
 
-    OAUTH_TESTS_ENABLED = OAUTH_AVAILABLE
-except ImportError:
-    OAUTH_TESTS_ENABLED = False
-    OAuth1EnhancedSession = None
-    OAuth2EnhancedSession = None
-    OAUTH_AVAILABLE = False
-    OAuthNotAvailableError = None
+
+@pytest.fixture
+def oauth2_mock(monkeypatch):
+    """Patch OAuth2Session with a copy of the template for a single test."""
+    mock = copy.copy(_OAUTH2_TEMPLATE)
+    mock.reset_mock()
+    monkeypatch.setattr(
+        "requests_enhanced.oauth._OAuth2Session", lambda *args, **kwargs: mock
+    )
+    return mock
 
 
 class TestOAuthAvailability:
     """Test OAuth availability detection."""
 
-    def test_oauth_available_flag(self):
+    def test_oauth_available_flag(self, oauth):
         """Test that OAUTH_AVAILABLE flag is correctly set."""
         # This test should pass regardless of whether OAuth is installed
-        assert isinstance(OAUTH_AVAILABLE, bool)
+        assert isinstance(oauth.OAUTH_AVAILABLE, bool)
 
-    @pytest.mark.skipif(
-        not OAUTH_TESTS_ENABLED, reason="OAuth dependencies not available"
-    )
-    def test_oauth_available_true(self):
-        """Test OAuth availability when dependencies are installed."""
-        assert OAUTH_AVAILABLE is True
-        assert OAuth1EnhancedSession is not None
-        assert OAuth2EnhancedSession is not None
-        assert OAuthNotAvailableError is not None
-
-    @pytest.mark.skipif(OAUTH_TESTS_ENABLED, reason="OAuth dependencies are available")
-    def test_oauth_available_false(self):
-        """Test OAuth availability when dependencies are not installed."""
-        assert OAUTH_AVAILABLE is False
-        # When OAuth is not available, classes should be None in __init__.py
-        # but this test runs when OAuth IS available, so we skip it
-
-
-@pytest.mark.skipif(not OAUTH_TESTS_ENABLED, reason="OAuth dependencies not available")
+    def test_oauth_imported_lazily(self):
+        """Test importing the package does not import the OAuth dependencies."""
+        code = (
+            "import sys, requests_enhanced; "
+            "assert 'requests_enhanced.oauth' not in sys.modules; "
+            "assert 'requests_oauthlib' not in sys.modules; "
+            "requests_enhanced.OAuthNotAvailableError; "
+            "assert 'requests_enhanced.oauth' in sys.modules"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_oauth_availability_consistent(self, oauth):
+        """Test OAuth availability matches whether the dependencies are installed."""
+        assert oauth.OAUTH_AVAILABLE is OAUTH_TESTS_ENABLED
+        assert oauth.OAuthNotAvailableError is not None
+
+        if oauth.OAUTH_AVAILABLE:
+            assert oauth.OAuth1EnhancedSession is not None
+            assert oauth.OAuth2EnhancedSession is not None
+
+
+@requires_oauth
 class TestOAuth1EnhancedSession:
     """Test OAuth 1.0/1.1 enhanced session functionality."""
 
-    def test_oauth1_session_creation(self):
+    def test_oauth1_session_creation(self, base_oauth1_session):
         """Test basic OAuth1 session creation."""
-        session = OAuth1EnhancedSession(
-            client_key="test_client_key", client_secret="test_client_secret"
-        )
+        session = base_oauth1_session
 
         assert session is not None
-        assert hasattr(session, "auth")
         assert session.auth is not None
         assert session._client_key == "test_client_key"
         assert session._client_secret == "test_client_secret"
 
-    def test_oauth1_session_with_tokens(self):
+    def test_oauth1_session_with_tokens(self, oauth):
         """Test OAuth1 session creation with access tokens."""
-        session = OAuth1EnhancedSession(
+        session = oauth.OAuth1EnhancedSession(
             client_key="test_client_key",
             client_secret="test_client_secret",
             resource_owner_key="test_access_token",
@@ -78,9 +182,9 @@ class TestOAuth1EnhancedSession:
         assert session._resource_owner_key == "test_access_token"
         assert session._resource_owner_secret == "test_access_secret"
 
-    def test_oauth1_session_with_enhanced_features(self):
+    def test_oauth1_session_with_enhanced_features(self, oauth):
         """Test OAuth1 session with enhanced session features."""
-        session = OAuth1EnhancedSession(
+        session = oauth.OAuth1EnhancedSession(
             client_key="test_client_key",
             client_secret="test_client_secret",
             timeout=30,
@@ -89,22 +193,24 @@ class TestOAuth1EnhancedSession:
         )
 
         # Should inherit enhanced session capabilities
-        assert hasattr(session, "timeout")
-        assert hasattr(session, "get")  # Basic session method
-        assert hasattr(session, "post")  # Basic session method
-
-    @patch("requests_enhanced.oauth._OAuth1Session")
-    def test_fetch_request_token(self, mock_oauth1_session):
+        assert getattr(session, "timeout", None) is not None
+        assert getattr(session, "get", None) is not None  # Basic session method
+        assert getattr(session, "post", None) is not None  # Basic session method
+
+    def test_oauth1_session_shares_adapters(self, base_oauth1_session):
+        """Test token requests reuse the enhanced session's connection pools."""
+        session = base_oauth1_session
+
+        for prefix, adapter in session.adapters.items():
+            token_adapter = session._oauth_session.adapters[prefix]
+            assert token_adapter.poolmanager is adapter.poolmanager
+            # Token POSTs must never be replayed after reaching the server
+            assert "POST" not in token_adapter.max_retries.allowed_methods
+            assert "POST" in adapter.max_retries.allowed_methods
+
+    def test_fetch_request_token(self, oauth, oauth1_mock):
         """Test fetching OAuth 1.0 request token."""
-        # Setup mock
-        mock_instance = Mock()
-        mock_instance.fetch_request_token.return_value = {
-            "oauth_token": "request_token",
-            "oauth_token_secret": "request_secret",
-        }
-        mock_oauth1_session.return_value = mock_instance
-
-        session = OAuth1EnhancedSession(
+        session = oauth.OAuth1EnhancedSession(
             client_key="test_client_key", client_secret="test_client_secret"
         )
 
@@ -117,17 +223,9 @@ class TestOAuth1EnhancedSession:
         assert session._resource_owner_key == "request_token"
         assert session._resource_owner_secret == "request_secret"
 
-    @patch("requests_enhanced.oauth._OAuth1Session")
-    def test_authorization_url(self, mock_oauth1_session):
+    def test_authorization_url(self, oauth, oauth1_mock):
         """Test generating OAuth 1.0 authorization URL."""
-        # Setup mock
-        mock_instance = Mock()
-        mock_instance.authorization_url.return_value = (
-            "https://api.example.com/oauth/authorize?oauth_token=test"
-        )
-        mock_oauth1_session.return_value = mock_instance
-
-        session = OAuth1EnhancedSession(
+        session = oauth.OAuth1EnhancedSession(
             client_key="test_client_key", client_secret="test_client_secret"
         )
 
@@ -135,20 +233,9 @@ class TestOAuth1EnhancedSession:
 
         assert auth_url == "https://api.example.com/oauth/authorize?oauth_token=test"
 
-    @patch("requests_enhanced.oauth._OAuth1Session")
-    def test_fetch_access_token(self, mock_oauth1_session):
+    def test_fetch_access_token(self, oauth, oauth1_mock):
         """Test fetching OAuth 1.0 access token."""
-        # Setup mock
-        mock_instance = Mock()
-        # Configure token as a dictionary to support item assignment
-        mock_instance.token = {}
-        mock_instance.fetch_access_token.return_value = {
-            "oauth_token": "access_token",
-            "oauth_token_secret": "access_secret",
-        }
-        mock_oauth1_session.return_value = mock_instance
-
-        session = OAuth1EnhancedSession(
+        session = oauth.OAuth1EnhancedSession(
             client_key="test_client_key", client_secret="test_client_secret"
         )
 
@@ -160,57 +247,72 @@ class TestOAuth1EnhancedSession:
         assert token["oauth_token_secret"] == "access_secret"
         assert session._resource_owner_key == "access_token"
         assert session._resource_owner_secret == "access_secret"
+        assert oauth1_mock.token["oauth_verifier"] == "test_verifier"
 
 
-@pytest.mark.skipif(not OAUTH_TESTS_ENABLED, reason="OAuth dependencies not available")
+@requires_oauth
 class TestOAuth2EnhancedSession:
     """Test OAuth 2.0 enhanced session functionality."""
 
-    def test_oauth2_session_creation(self):
+    def test_oauth2_session_creation(self, base_oauth2_session):
         """Test basic OAuth2 session creation."""
-        session = OAuth2EnhancedSession(client_id="test_client_id")
+        session = base_oauth2_session
 
         assert session is not None
         assert session._client_id == "test_client_id"
         assert session.token is None
         assert session.auth is None  # No auth until token is set
 
-    def test_oauth2_session_with_token(self):
+    def test_oauth2_session_with_token(self, oauth):
         """Test OAuth2 session creation with existing token."""
-        token = {
-            "access_token": "test_access_token",
-            "token_type": "Bearer",
-            "expires_in": 3600,
-        }
-
-        session = OAuth2EnhancedSession(client_id="test_client_id", token=token)
+        session = oauth.OAuth2EnhancedSession(client_id="test_client_id", token=_BEARER)
 
-        assert session.token == token
+        assert session.token == _BEARER
         assert session.auth is not None
 
-    def test_oauth2_session_with_enhanced_features(self):
+    def test_oauth2_session_with_enhanced_features(self, oauth):
         """Test OAuth2 session with enhanced session features."""
-        session = OAuth2EnhancedSession(
+        session = oauth.OAuth2EnhancedSession(
             client_id="test_client_id", timeout=30, max_retries=5, http_version="3"
         )
 
         # Should inherit enhanced session capabilities
-        assert hasattr(session, "timeout")
-        assert hasattr(session, "get")  # Basic session method
-        assert hasattr(session, "post")  # Basic session method
+        assert getattr(session, "timeout", None) is not None
+        assert getattr(session, "get", None) is not None  # Basic session method
+        assert getattr(session, "post", None) is not None  # Basic session method
 
-    @patch("requests_enhanced.oauth._OAuth2Session")
-    def test_authorization_url(self, mock_oauth2_session):
-        """Test generating OAuth 2.0 authorization URL."""
-        # Setup mock
-        mock_instance = Mock()
-        mock_instance.authorization_url.return_value = (
-            "https://api.example.com/oauth/authorize?client_id=test&state=random",
-            "random_state",
+    def test_oauth2_session_shares_adapters(self, base_oauth2_session):
+        """Test token requests reuse the enhanced session's connection pools."""
+        session = base_oauth2_session
+
+        for prefix, adapter in session.adapters.items():
+            token_adapter = session._oauth_session.adapters[prefix]
+            assert token_adapter.poolmanager is adapter.poolmanager
+            # Token POSTs must never be replayed after reaching the server
+            assert "POST" not in token_adapter.max_retries.allowed_methods
+            assert "POST" in adapter.max_retries.allowed_methods
+
+    def test_fetch_token_not_retried_on_server_error(
+        self, oauth, http_server, monkeypatch
+    ):
+        """Test a 5xx from the token endpoint is not replayed by the retries."""
+        from oauthlib.oauth2 import ServerError
+
+        # oauthlib refuses plain-HTTP token URLs unless this is set
+        monkeypatch.setenv("OAUTHLIB_INSECURE_TRANSPORT", "1")
+        http_server.expect_request("/token", method="POST").respond_with_json(
+            {"error": "server_error"}, status=500
         )
-        mock_oauth2_session.return_value = mock_instance
+        session = oauth.OAuth2EnhancedSession(client_id="test_client_id")
 
-        session = OAuth2EnhancedSession(client_id="test_client_id")
+        with pytest.raises(ServerError):
+            session.fetch_token(http_server.url_for("/token"), code="single_use_code")
+
+        assert len(http_server.log) == 1
+
+    def test_authorization_url(self, oauth2_mock, fresh_oauth2):
+        """Test generating OAuth 2.0 authorization URL."""
+        session = fresh_oauth2
 
         auth_url, state = session.authorization_url(
             "https://api.example.com/oauth/authorize"
@@ -220,21 +322,26 @@ class TestOAuth2EnhancedSession:
         assert state == "random_state"
         assert session._state == "random_state"
 
-    @patch("requests_enhanced.oauth._OAuth2Session")
-    def test_fetch_token(self, mock_oauth2_session):
-        """Test fetching OAuth 2.0 access token."""
-        # Setup mock
-        mock_instance = Mock()
-        mock_token = {
-            "access_token": "test_access_token",
-            "token_type": "Bearer",
-            "expires_in": 3600,
-            "refresh_token": "test_refresh_token",
-        }
-        mock_instance.fetch_token.return_value = mock_token
-        mock_oauth2_session.return_value = mock_instance
+    def test_authorization_url_uses_state_generator(self, oauth):
+        """Test a custom state_generator supplies the authorization state."""
+        states = iter(["state_one", "state_two"])
+        session = oauth.OAuth2EnhancedSession(
+            client_id="test_client_id", state_generator=lambda: next(states)
+        )
 
-        session = OAuth2EnhancedSession(client_id="test_client_id")
+        auth_url, state = session.authorization_url(
+            "https://api.example.com/oauth/authorize"
+        )
+        assert state == "state_one"
+        assert "state=state_one" in auth_url
+
+        _, state = session.authorization_url("https://api.example.com/oauth/authorize")
+        assert state == "state_two"
+
+    def test_fetch_token(self, oauth2_mock, fresh_oauth2):
+        """Test fetching OAuth 2.0 access token."""
+        mock_token = oauth2_mock.fetch_token.return_value
+        session = fresh_oauth2
 
         token = session.fetch_token(
             "https://api.example.com/oauth/token",
@@ -245,60 +352,48 @@ class TestOAuth2EnhancedSession:
         assert session.token == mock_token
         assert session.auth is not None
 
-    @patch("requests_enhanced.oauth._OAuth2Session")
-    def test_refresh_token(self, mock_oauth2_session):
+    def test_refresh_token(self, oauth2_mock, fresh_oauth2):
         """Test refreshing OAuth 2.0 access token."""
-        # Setup mock
-        mock_instance = Mock()
-        mock_new_token = {
-            "access_token": "new_access_token",
-            "token_type": "Bearer",
-            "expires_in": 3600,
-            "refresh_token": "new_refresh_token",
-        }
-        mock_instance.refresh_token.return_value = mock_new_token
-        mock_oauth2_session.return_value = mock_instance
+        mock_new_token = oauth2_mock.refresh_token.return_value
 
-        # Create session with existing token
-        old_token = {
+        # Only the stored refresh token matters here, so skip building its auth
+        session = fresh_oauth2
+        session._token = {
             "access_token": "old_access_token",
             "refresh_token": "old_refresh_token",
         }
-        session = OAuth2EnhancedSession(client_id="test_client_id", token=old_token)
 
         new_token = session.refresh_token("https://api.example.com/oauth/token")
 
+        call_kwargs = oauth2_mock.refresh_token.call_args[1]
+        assert call_kwargs["refresh_token"] == "old_refresh_token"
         assert new_token == mock_new_token
         assert session.token == mock_new_token
 
-    def test_token_property(self):
+    @pytest.mark.parametrize(
+        "tokens",
+        [[], [_BEARER], [_BEARER, None]],
+        ids=["initially-unset", "set", "cleared"],
+    )
+    def test_token_property(self, fresh_oauth2, tokens):
         """Test token property getter and setter."""
-        session = OAuth2EnhancedSession(client_id="test_client_id")
+        session = fresh_oauth2
+        for token in tokens:
+            session.token = token
 
-        # Initially no token
-        assert session.token is None
-        assert session.auth is None
-
-        # Set token
-        token = {"access_token": "test_token", "token_type": "Bearer"}
-        session.token = token
+        # Auth follows the last token assigned, if any
+        expected = tokens[-1] if tokens else None
+        assert session.token == expected
+        assert (session.auth is None) == (expected is None)
 
-        assert session.token == token
-        assert session.auth is not None
-
-        # Clear token
-        session.token = None
-        assert session.token is None
-        assert session.auth is None
-
-    def test_token_updater_callback(self):
+    def test_token_updater_callback(self, oauth):
         """Test token updater callback functionality."""
         updated_tokens = []
 
         def token_updater(token):
             updated_tokens.append(token)
 
-        session = OAuth2EnhancedSession(
+        session = oauth.OAuth2EnhancedSession(
             client_id="test_client_id", token_updater=token_updater
         )
 
@@ -310,60 +405,131 @@ class TestOAuth2EnhancedSession:
         assert updated_tokens[0] == new_token
         assert session.token == new_token
 
+    def test_token_cache_tracks_expiry(self, oauth):
+        """Test the token cache records the token's skewed expiry."""
+        token = {
+            "access_token": "test_access_token",
+            "refresh_token": "test_refresh_token",
+            "expires_in": 3600,
+        }
+        session = oauth.OAuth2EnhancedSession(client_id="test_client_id", token=token)
+
+        assert session._token_cache.access_token == "test_access_token"
+        assert session._token_cache.refresh_token == "test_refresh_token"
+        assert not session._token_cache.expired
+
+        # Lifetimes inside the safety skew are already stale
+        session.token = {"access_token": "short_lived", "expires_in": 10}
+        assert session._token_cache.expired
+
+        # Tokens without an expiry stay cached indefinitely
+        session.token = {"access_token": "long_lived"}
+        assert not session._token_cache.expired
+
+        session.token = None
+        assert session._token_cache is None
+
+    def test_request_uses_cached_token(self, monkeypatch, oauth, oauth2_mock):
+        """Test requests with an unexpired token skip the refresh round trip."""
+        mock_request = Mock()
+        monkeypatch.setattr("requests_enhanced.sessions.Session.request", mock_request)
+        session = oauth.OAuth2EnhancedSession(
+            client_id="test_client_id",
+            token={"access_token": "test_access_token", "expires_in": 3600},
+            auto_refresh_url="https://api.example.com/oauth/token",
+        )
+        session.get("https://api.example.com/data")
+
+        oauth2_mock.refresh_token.assert_not_called()
+        mock_request.assert_called_once()
+
+    def test_request_refreshes_expired_token(self, monkeypatch, oauth, oauth2_mock):
+        """Test an expired cached token is refreshed once before the request."""
+        mock_request = Mock()
+        monkeypatch.setattr("requests_enhanced.sessions.Session.request", mock_request)
+        mock_new_token = oauth2_mock.refresh_token.return_value
+        updated_tokens = []
+
+        session = oauth.OAuth2EnhancedSession(
+            client_id="test_client_id",
+            token={
+                "access_token": "old_access_token",
+                "refresh_token": "old_refresh_token",
+                "expires_in": 0,
+            },
+            auto_refresh_url="https://api.example.com/oauth/token",
+            token_updater=updated_tokens.append,
+        )
+        session.get("https://api.example.com/data")
+        session.get("https://api.example.com/data")
+
+        oauth2_mock.refresh_token.assert_called_once()
+        call_kwargs = oauth2_mock.refresh_token.call_args[1]
+        assert call_kwargs["refresh_token"] == "old_refresh_token"
+        assert session.token == mock_new_token
+        assert updated_tokens == [mock_new_token]
+        assert mock_request.call_count == 2
+
 
-@pytest.mark.skipif(not OAUTH_TESTS_ENABLED, reason="OAuth dependencies not available")
+@requires_oauth
 class TestOAuthComprehensiveIntegration:
     """Test comprehensive OAuth integration with HTTP versions, retries, timeouts, JSON, and logging."""
 
-    def test_oauth1_with_http1(self):
+    def test_oauth1_with_http1(self, base_oauth1_session):
         """Test OAuth1 session with HTTP/1.1 (default)."""
-        session = OAuth1EnhancedSession(
-            client_key="test_key",
-            client_secret="test_secret",
-            # No http_version specified = HTTP/1.1 default
-        )
+        # No http_version specified = HTTP/1.1 default
+        session = base_oauth1_session
 
-        assert hasattr(session, "get")
-        assert hasattr(session, "post")
-        # Should work with default HTTP/1.1
+        assert getattr(session, "get", None) is not None
+        assert getattr(session, "post", None) is not None
+        assert session.http_version == "1.1"
 
-    def test_oauth1_with_http2(self):
-        """Test OAuth1 session with HTTP/2."""
-        session = OAuth1EnhancedSession(
-            client_key="test_key", client_secret="test_secret", http_version="2"
-        )
+    @pytest.mark.parametrize(
+        "session_class, kwargs",
+        [
+            (
+                "OAuth1EnhancedSession",
+                {
+                    "client_key": "test_key",
+                    "client_secret": "test_secret",
+                    "http_version": "2",
+                },
+            ),
+            (
+                "OAuth2EnhancedSession",
+                {"client_id": "test_client_id", "http_version": "3"},
+            ),
+        ],
+        ids=["oauth1-http2", "oauth2-http3"],
+    )
+    def test_oauth_with_http_version(self, oauth, session_class, kwargs):
+        """Test OAuth sessions accept an explicit HTTP version."""
+        # Named rather than referenced so collection does not import the module
+        session = getattr(oauth, session_class)(**kwargs)
 
-        assert hasattr(session, "http_version")
+        assert getattr(session, "http_version", None) is not None
         # The actual HTTP version setting depends on the Session implementation
 
-    def test_oauth2_with_http1(self):
+    def test_oauth2_with_http1(self, base_oauth2_session):
         """Test OAuth2 session with HTTP/1.1 (default)."""
-        session = OAuth2EnhancedSession(
-            client_id="test_client_id"
-            # No http_version specified = HTTP/1.1 default
-        )
+        # No http_version specified = HTTP/1.1 default
+        session = base_oauth2_session
 
-        assert hasattr(session, "get")
-        assert hasattr(session, "post")
-        # Should work with default HTTP/1.1
-
-    def test_oauth2_with_http3(self):
-        """Test OAuth2 session with HTTP/3."""
-        session = OAuth2EnhancedSession(client_id="test_client_id", http_version="3")
-
-        assert hasattr(session, "http_version")
-        # The actual HTTP version setting depends on the Session implementation
+        assert getattr(session, "get", None) is not None
+        assert getattr(session, "post", None) is not None
+        assert session.http_version == "1.1"
 
-    @patch("requests_enhanced.sessions.Session.get")
-    def test_oauth_request_with_different_protocols(self, mock_get):
+    def test_oauth_request_with_different_protocols(self, monkeypatch, oauth):
         """Test OAuth sessions can make requests with different HTTP protocols."""
+        mock_get = Mock()
+        monkeypatch.setattr("requests_enhanced.sessions.Session.get", mock_get)
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.json.return_value = {"data": "test"}
         mock_get.return_value = mock_response
 
         # Test OAuth1 with HTTP/2
-        oauth1_session = OAuth1EnhancedSession(
+        oauth1_session = oauth.OAuth1EnhancedSession(
             client_key="test_key", client_secret="test_secret", http_version="2"
         )
 
@@ -371,33 +537,17 @@ class TestOAuthComprehensiveIntegration:
         assert response.status_code == 200
 
         # Test OAuth2 with HTTP/3
-        oauth2_session = OAuth2EnhancedSession(
+        oauth2_session = oauth.OAuth2EnhancedSession(
             client_id="test_client_id", http_version="3"
         )
 
         response = oauth2_session.get("https://api.example.com/data")
         assert response.status_code == 200
 
-    def test_oauth_with_retry_configuration(self):
-        """Test OAuth sessions with retry configuration."""
-        oauth1_session = OAuth1EnhancedSession(
-            client_key="test_key",
-            client_secret="test_secret",
-            max_retries=3,
-            timeout=30,
-        )
-
-        oauth2_session = OAuth2EnhancedSession(
-            client_id="test_client_id", max_retries=5, timeout=45
-        )
-
-        # Both should inherit retry capabilities from enhanced Session
-        assert hasattr(oauth1_session, "get")
-        assert hasattr(oauth2_session, "post")
-
-    @patch("requests_enhanced.sessions.Session.get")
-    def test_oauth_retry_behavior(self, mock_get):
+    def test_oauth_retry_behavior(self, monkeypatch, oauth):
         """Test that OAuth sessions properly retry failed requests."""
+        mock_get = Mock()
+        monkeypatch.setattr("requests_enhanced.sessions.Session.get", mock_get)
         # Setup mock to succeed on first call (OAuth sessions inherit retry from base Session)
         mock_response_success = Mock()
         mock_response_success.status_code = 200
@@ -405,7 +555,7 @@ class TestOAuthComprehensiveIntegration:
 
         mock_get.return_value = mock_response_success
 
-        session = OAuth1EnhancedSession(
+        session = oauth.OAuth1EnhancedSession(
             client_key="test_key", client_secret="test_secret", max_retries=3
         )
 
@@ -415,30 +565,32 @@ class TestOAuthComprehensiveIntegration:
         assert mock_get.call_count == 1  # Should succeed on first try
         assert response.json()["success"] is True
 
-    @patch("requests_enhanced.sessions.Session.get")
-    def test_oauth_timeout_behavior(self, mock_get):
+    def test_oauth_timeout_behavior(self, monkeypatch, oauth):
         """Test OAuth sessions respect timeout settings."""
         from requests.exceptions import Timeout
 
+        mock_get = Mock()
+        monkeypatch.setattr("requests_enhanced.sessions.Session.get", mock_get)
         mock_get.side_effect = Timeout("Request timed out")
 
-        session = OAuth2EnhancedSession(
+        session = oauth.OAuth2EnhancedSession(
             client_id="test_client_id", timeout=1  # Very short timeout
         )
 
         with pytest.raises(Timeout):
             session.get("https://api.example.com/slow-endpoint")
 
-    @patch("requests_enhanced.sessions.Session.post")
-    def test_oauth_json_integration(self, mock_post):
+    def test_oauth_json_integration(self, monkeypatch, oauth):
         """Test OAuth sessions with JSON API requests."""
+        mock_post = Mock()
+        monkeypatch.setattr("requests_enhanced.sessions.Session.post", mock_post)
         mock_response = Mock()
         mock_response.status_code = 201
         mock_response.json.return_value = {"id": 123, "created": True}
         mock_post.return_value = mock_response
 
         # Test OAuth1 with JSON
-        oauth1_session = OAuth1EnhancedSession(
+        oauth1_session = oauth.OAuth1EnhancedSession(
             client_key="test_key", client_secret="test_secret"
         )
 
@@ -459,9 +611,10 @@ class TestOAuthComprehensiveIntegration:
             headers={"Content-Type": "application/json"},
         )
 
-    @patch("requests_enhanced.sessions.Session.get")
-    def test_oauth_json_response_handling(self, mock_get):
+    def test_oauth_json_response_handling(self, monkeypatch, oauth):
         """Test OAuth sessions properly handle JSON responses."""
+        mock_get = Mock()
+        monkeypatch.setattr("requests_enhanced.sessions.Session.get", mock_get)
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.headers = {"Content-Type": "application/json"}
@@ -472,9 +625,9 @@ class TestOAuthComprehensiveIntegration:
         }
         mock_get.return_value = mock_response
 
-        session = OAuth2EnhancedSession(
+        session = oauth.OAuth2EnhancedSession(
             client_id="test_client_id",
-            token={"access_token": "test_token", "token_type": "Bearer"},
+            token=_BEARER,
         )
 
         response = session.get("https://api.example.com/user/profile")
@@ -484,11 +637,14 @@ class TestOAuthComprehensiveIntegration:
         assert json_data["user"]["id"] == 123
         assert "read" in json_data["permissions"]
 
-    @patch("requests_enhanced.oauth.logger")
-    def test_oauth_logging_verification(self, mock_logger):
+    def test_oauth_logging_verification(self, monkeypatch, oauth):
         """Test that OAuth operations generate appropriate log messages."""
+        mock_logger = Mock()
+        monkeypatch.setattr("requests_enhanced.oauth.logger", mock_logger)
         # Test OAuth1 session creation logging
-        OAuth1EnhancedSession(client_key="test_client_key", client_secret="test_secret")
+        oauth.OAuth1EnhancedSession(
+            client_key="test_client_key", client_secret="test_secret"
+        )
 
         # Verify initialization was logged
         mock_logger.info.assert_called_with(
@@ -499,26 +655,18 @@ class TestOAuthComprehensiveIntegration:
         mock_logger.reset_mock()
 
         # Test OAuth2 session creation logging
-        OAuth2EnhancedSession(client_id="test_client_id")
+        oauth.OAuth2EnhancedSession(client_id="test_client_id")
 
         # Verify initialization was logged
         mock_logger.info.assert_called_with(
             "OAuth2EnhancedSession initialized with client_id: test_cli..."
         )
 
-    @patch("requests_enhanced.oauth.logger")
-    @patch("requests_enhanced.oauth._OAuth1Session")
-    def test_oauth1_operation_logging(self, mock_oauth1_session, mock_logger):
+    def test_oauth1_operation_logging(self, monkeypatch, oauth, oauth1_mock):
         """Test OAuth1 operations generate proper log messages."""
-        # Setup mock
-        mock_instance = Mock()
-        mock_instance.fetch_request_token.return_value = {
-            "oauth_token": "request_token",
-            "oauth_token_secret": "request_secret",
-        }
-        mock_oauth1_session.return_value = mock_instance
-
-        session = OAuth1EnhancedSession(
+        mock_logger = Mock()
+        monkeypatch.setattr("requests_enhanced.oauth.logger", mock_logger)
+        session = oauth.OAuth1EnhancedSession(
             client_key="test_key", client_secret="test_secret"
         )
 
@@ -542,11 +690,12 @@ class TestOAuthComprehensiveIntegration:
                 expected_msg in actual_call for actual_call in actual_calls
             ), f"Expected log message '{expected_msg}' not found in {actual_calls}"
 
-    @patch("requests_enhanced.sessions.Session.get")
-    def test_oauth_error_handling_with_retries(self, mock_get):
+    def test_oauth_error_handling_with_retries(self, monkeypatch, oauth):
         """Test OAuth error handling triggers retry mechanisms."""
         from requests.exceptions import ConnectionError
 
+        mock_get = Mock()
+        monkeypatch.setattr("requests_enhanced.sessions.Session.get", mock_get)
         # Setup mock to succeed (OAuth sessions inherit error handling from base Session)
         mock_response_success = Mock()
         mock_response_success.status_code = 200
@@ -554,10 +703,10 @@ class TestOAuthComprehensiveIntegration:
 
         mock_get.return_value = mock_response_success
 
-        session = OAuth2EnhancedSession(
+        session = oauth.OAuth2EnhancedSession(
             client_id="test_client_id",
             max_retries=2,
-            token={"access_token": "test_token", "token_type": "Bearer"},
+            token=_BEARER,
         )
 
         # Should succeed
@@ -567,39 +716,38 @@ class TestOAuthComprehensiveIntegration:
         assert response.json()["data"] == "success"
 
 
-@pytest.mark.skipif(not OAUTH_TESTS_ENABLED, reason="OAuth dependencies not available")
+@requires_oauth
 class TestOAuthErrorHandling:
     """Test OAuth error handling."""
 
-    def test_oauth_not_available_error(self):
+    def test_oauth_not_available_error(self, oauth):
         """Test OAuthNotAvailableError exception."""
-        error = OAuthNotAvailableError()
+        error = oauth.OAuthNotAvailableError()
         assert "OAuth functionality requires 'requests-oauthlib' package" in str(error)
 
-        custom_error = OAuthNotAvailableError("Custom message")
+        custom_error = oauth.OAuthNotAvailableError("Custom message")
         assert str(custom_error) == "Custom message"
 
-    @patch("requests_enhanced.oauth.OAUTH_AVAILABLE", False)
-    def test_check_oauth_available_raises_error(self):
+    def test_check_oauth_available_raises_error(self, monkeypatch, oauth):
         """Test that _check_oauth_available raises error when OAuth not available."""
-        with pytest.raises(OAuthNotAvailableError):
-            _check_oauth_available()
+        monkeypatch.setattr(oauth, "OAUTH_AVAILABLE", False)
 
+        with pytest.raises(oauth.OAuthNotAvailableError):
+            oauth._check_oauth_available()
 
-@pytest.mark.skipif(OAUTH_TESTS_ENABLED, reason="OAuth dependencies are available")
+
+@without_oauth
 class TestOAuthUnavailable:
     """Test behavior when OAuth dependencies are not available."""
 
     def test_oauth_classes_are_none_when_unavailable(self):
         """Test that OAuth classes are None when dependencies unavailable."""
-        # This test only runs when OAuth is NOT available
-        # In that case, the imports in __init__.py should set classes to None
-        from requests_enhanced import (
-            OAuth1EnhancedSession as OAuth1,
-            OAuth2EnhancedSession as OAuth2,
-            OAUTH_AVAILABLE as available,
-        )
-
-        assert available is False
-        assert OAuth1 is None
-        assert OAuth2 is None
+        # This test only runs when OAuth is NOT available, which __init__.py
+        # detects with the same spec lookup
+        assert importlib.util.find_spec("requests_oauthlib") is None
+
+        # OAUTH_AVAILABLE is answered from the spec alone; the session classes
+        # are None rather than missing
+        assert requests_enhanced.OAUTH_AVAILABLE is False
+        assert requests_enhanced.OAuth1EnhancedSession is None
+        assert requests_enhanced.OAuth2EnhancedSession is None
@@ -6,7 +6,7 @@ import pytest
 import requests
 from requests.adapters import Retry
 
-from requests_enhanced import Session
+from requests_enhanced import HTTP2_AVAILABLE, Session
 from requests_enhanced.exceptions import RequestTimeoutError, RequestRetryError
 
 
@@ -49,6 +49,43 @@ def test_session_custom_retry():
     assert "GET" in adapter.max_retries.allowed_methods
 
 
+def test_session_custom_pool_size():
+    """Test Session passes pool sizing through to every mounted adapter."""
+    session = Session(pool_connections=4, pool_maxsize=25)
+
+    assert session.pool_connections == 4
+    assert session.pool_maxsize == 25
+    for prefix in ("http://", "https://"):
+        adapter = session.adapters[prefix]
+        assert adapter._pool_connections == 4
+        assert adapter._pool_maxsize == 25
+        assert adapter.poolmanager.connection_pool_kw["maxsize"] == 25
+        assert adapter._pool_block is False
+
+
+@pytest.mark.skipif(not HTTP2_AVAILABLE, reason="HTTP/2 dependencies not available")
+@pytest.mark.parametrize("http_version", ["1.1", "2"])
+def test_session_pool_size_reaches_https_pools(http_version):
+    """Test pool sizing reaches the connection pools each adapter creates."""
+    session = Session(http_version=http_version, pool_maxsize=25, pool_block=True)
+
+    for url in ("http://example.com", "https://example.com"):
+        pool = session.get_adapter(url).poolmanager.connection_from_url(url)
+        assert pool.pool.maxsize == 25
+        assert pool.block is True
+
+
+def test_session_pool_block():
+    """Test Session can make saturated pools block instead of discarding."""
+    session = Session(pool_block=True)
+
+    assert session.pool_block is True
+    for prefix in ("http://", "https://"):
+        adapter = session.adapters[prefix]
+        assert adapter._pool_block is True
+        assert adapter.poolmanager.connection_pool_kw["block"] is True
+
+
 def test_session_request_with_default_timeout(
     monkeypatch, configuring_logger_for_tests
 ):